@@ -0,0 +1,52 @@
+"""
+Measure how long a short-lived process takes to start using the client:
+importing twilio.rest in a fresh interpreter, constructing a
+TwilioRestClient and touching its first resource.
+
+    python benchmarks/startup.py [runs]
+"""
+import os
+import subprocess
+import sys
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+IMPORT = """
+import time
+start = time.time()
+import twilio.rest
+print time.time() - start
+"""
+
+
+def import_times(runs):
+    times = []
+    for i in range(runs):
+        output = subprocess.check_output([sys.executable, "-c", IMPORT],
+                                         cwd=ROOT)
+        times.append(float(output))
+    return sorted(times)
+
+
+def best(statement, setup, number=1000, repeat=5):
+    timer = timeit.Timer(statement, setup)
+    return min(timer.repeat(repeat, number)) / number
+
+
+def main(runs=20):
+    sys.path.insert(0, ROOT)
+    setup = "from twilio.rest import TwilioRestClient"
+
+    times = import_times(runs)
+    construct = best('TwilioRestClient("AC123", "token")', setup)
+    first = best('TwilioRestClient("AC123", "token").calls', setup)
+
+    print "import twilio.rest    %8.2f ms (median of %d)" % (
+        times[len(times) // 2] * 1000, runs)
+    print "TwilioRestClient()    %8.2f us" % (construct * 1e6)
+    print "  + first resource    %8.2f us" % (first * 1e6)
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,74 @@
+"""
+Compare building TwiML with Verb.toxml(), which goes through ElementTree,
+against Verb.render(), which writes the XML directly, and against
+rendering a precompiled Template.
+
+    python benchmarks/twiml.py [number]
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from twilio import twiml
+
+
+def gather(action="/menu", prompt="For sales, press 1. For support, "
+           "press 2."):
+    r = twiml.Response()
+    g = r.gather(action=action, method="POST", numDigits=1, timeout=10)
+    g.say(prompt, voice="woman")
+    g.play("http://example.com/menu.mp3")
+    g.pause(length=1)
+    r.say("We didn't receive any input. Goodbye!")
+    r.hangup()
+    return r
+
+
+def dial(number="+14155550000"):
+    r = twiml.Response()
+    r.say("Connecting you now", voice="man", language="en")
+    d = r.dial(action="/dial-status", callerId="+14155551234", timeout=20)
+    d.number(number, sendDigits="ww1234")
+    d.number("+14155550001")
+    r.redirect("/voicemail", method="POST")
+    return r
+
+
+def main(number=10000):
+    for name, build in [("Gather", gather), ("Dial", dial)]:
+        doc = build()
+        assert doc.render() == doc.toxml()
+
+        toxml = min(timeit.repeat(doc.toxml, number=number, repeat=3))
+        render = min(timeit.repeat(doc.render, number=number, repeat=3))
+
+        print "%-7s toxml %7.2f us  render %7.2f us  (%.1fx)" % (
+            name, toxml / number * 1e6, render / number * 1e6,
+            toxml / render)
+
+    templates = [
+        ("Gather", twiml.Template(gather(twiml.Slot("action"),
+                                         twiml.Slot("prompt"))),
+         lambda: gather("/menu", "Press 1").render(),
+         {"action": "/menu", "prompt": "Press 1"}),
+        ("Dial", twiml.Template(dial(twiml.Slot("number"))),
+         lambda: dial("+14155550000").render(),
+         {"number": "+14155550000"}),
+        ]
+
+    for name, template, build, values in templates:
+        assert template.render(**values) == build()
+
+        built = min(timeit.repeat(build, number=number, repeat=3))
+        rendered = min(timeit.repeat(lambda: template.render(**values),
+                                     number=number, repeat=3))
+
+        print "%-7s build+render %7.2f us  template %7.2f us  (%.1fx)" % (
+            name, built / number * 1e6, rendered / number * 1e6,
+            built / rendered)
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
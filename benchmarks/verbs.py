@@ -0,0 +1,68 @@
+"""
+Measure the objects allocated and the time taken to build a typical
+10-verb TwiML response.
+
+    python benchmarks/verbs.py [number]
+"""
+import gc
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from twilio import twiml
+
+
+def build():
+    r = twiml.Response()
+    r.say("Thanks for calling", voice="woman")
+    g = r.gather(action="/menu", numDigits=1, timeout=5)
+    g.say("For sales, press 1")
+    g.say("For support, press 2")
+    g.pause(length=1)
+    r.play("http://example.com/hold.mp3")
+    d = r.dial(action="/dial-status", timeout=20)
+    d.number("+14155550000")
+    r.redirect("/voicemail")
+    return r
+
+
+def tracked_objects():
+    """
+    Return the number of objects the garbage collector tracks. This
+    counts live verbs and lists, and any dict that holds another container
+    """
+    gc.collect()
+    return len(gc.get_objects())
+
+
+def retained_size(verb):
+    """
+    Return the bytes held by a verb tree: the verbs, their attribute dicts
+    and their lists of nested verbs
+    """
+    size = sys.getsizeof(verb)
+    for attr in ("__dict__", "attrs", "verbs"):
+        value = getattr(verb, attr, None)
+        if value is not None:
+            size += sys.getsizeof(value)
+    return size + sum(retained_size(child) for child in verb.verbs)
+
+
+def main(number=20000):
+    gc.disable()
+    before = tracked_objects()
+    response = build()
+    objects = tracked_objects() - before
+    gc.enable()
+
+    seconds = min(timeit.repeat(build, number=number, repeat=3)) / number
+
+    print "objects per response  %6d" % objects
+    print "bytes per response    %6d" % retained_size(response)
+    print "build time            %6.2f us" % (seconds * 1e6)
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
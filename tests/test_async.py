@@ -0,0 +1,90 @@
+"""
+Test the AsyncTwilioRestClient against a local HTTP server
+"""
+import unittest
+from nose.tools import assert_equals, assert_true, raises
+from tools import TwilioServer
+from twilio import TwilioException
+from twilio import TwilioRestException
+from twilio.rest import AsyncTwilioRestClient
+from twilio.rest.resources import Call
+from twilio.rest.resources import Executor
+from twilio.rest.resources import Future
+
+
+class AsyncClientTest(unittest.TestCase):
+
+    def setUp(self):
+        self.server = TwilioServer()
+        self.server.start()
+        self.client = AsyncTwilioRestClient("AC123", "token",
+                                            base=self.server.base, workers=2)
+
+    def tearDown(self):
+        self.client.close()
+        self.server.stop()
+
+    def testCreateReturnsFuture(self):
+        future = self.client.calls.create(to="+15555555555",
+                                          from_="+15555555556",
+                                          url="http://example.com")
+        self.assertIsInstance(future, Future)
+
+        call = future.result(5)
+        self.assertIsInstance(call, Call)
+        self.assertEquals(call.sid, "CA47e13748ed59a5733d2c1c1c69a83a28")
+
+        method, path, auth = self.server.requests[0]
+        self.assertEquals(auth, "Basic QUMxMjM6dG9rZW4=")
+
+    def testNestedResource(self):
+        futures = [self.client.sms.messages.list() for i in range(6)]
+        for future in futures:
+            self.assertEquals(len(future.result(5)), 50)
+
+        # Connections are kept alive and shared between requests
+        self.assertEquals(len(self.server.requests), 6)
+        self.assertTrue(len(self.server.clients) <= 2)
+
+    def testError(self):
+        future = self.client.calls.get("CA404")
+        self.assertRaises(TwilioRestException, future.result, 5)
+        self.assertEquals(future.exception().status, 404)
+
+    def testIterators(self):
+        self.assertRaises(TwilioException, getattr, self.client.calls, "iter")
+        self.assertRaises(TwilioException, getattr, self.client.calls,
+                          "create_many")
+        self.assertRaises(TwilioException, getattr,
+                          self.client.sms.messages, "export")
+
+        future = self.client.sms.messages.list(stream=True)
+        self.assertRaises(TwilioException, future.result, 5)
+
+    def testParticipants(self):
+        participants = self.client.participants("CF123")
+        self.assertEquals(participants.uri,
+                          self.client.client.account_uri +
+                          "/Conferences/CF123/Participants")
+
+
+def test_executor_submit():
+    executor = Executor(2)
+    futures = [executor.submit(pow, i, 2) for i in range(10)]
+    assert_equals([f.result(5) for f in futures], [i ** 2 for i in range(10)])
+    assert_true(len(executor._threads) <= 2)
+    executor.shutdown()
+
+
+def test_future_callback():
+    results = []
+    future = Future()
+    future.add_done_callback(lambda f: results.append(f.result()))
+    future.set_result(3)
+    future.add_done_callback(lambda f: results.append(f.result() + 1))
+    assert_equals(results, [3, 4])
+
+
+@raises(TwilioException)
+def test_future_timeout():
+    Future().result(0.01)
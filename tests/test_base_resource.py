@@ -1,13 +1,19 @@
 """
 Test the base Resource class
 """
+import copy
+import pickle
 import unittest
 from mock import Mock
-from nose.tools import assert_equals
+from nose.tools import assert_equals, assert_true
 from nose.tools import raises
 from twilio.rest.resources import Resource
 from twilio.rest.resources import ListResource
 from twilio.rest.resources import InstanceResource
+from twilio.rest.resources import Call
+from twilio.rest.resources import Calls
+from twilio.rest.resources import Transport
+from twilio.rest.resources import Recordings
 
 base_uri = "https://api.twilio.com/2010-04-01"
 account_sid = "AC123"
@@ -29,6 +35,30 @@ def test_equivalence():
     assert_equals(r1, r2)
 
 
+def test_pickle_with_transport():
+    calls = Calls(base_uri, auth, Transport(auth))
+    call = calls.load_instance({"sid": "CA123", "status": "completed"})
+    call.recordings
+
+    copied = pickle.loads(pickle.dumps(call))
+    assert_equals(copied.sid, "CA123")
+    assert_equals(copied.status, "completed")
+    assert_equals(copied.transport, None)
+    assert_equals(copied.parent.transport, None)
+
+
+def test_deepcopy_shares_transport():
+    transport = Transport(auth)
+    call = Calls(base_uri, auth, transport).load_instance({"sid": "CA123"})
+
+    copied = copy.deepcopy(call)
+    assert_equals(copied.sid, "CA123")
+    assert_true(copied is not call)
+    assert_true(copied.parent is not call.parent)
+    assert_true(copied.transport is transport)
+    assert_true(copied.parent.transport is transport)
+
+
 class ListResourceTest(unittest.TestCase):
 
     def setUp(self):
@@ -79,5 +109,36 @@ class testInstanceResourceInit(unittest.TestCase):
         m = Mock()
         self.r.subresources = [m]
         self.r.load_subresources()
-        m.assert_called_with(self.r.uri, self.r.auth)
+        m.assert_called_with(self.r.uri, self.r.auth, self.r.transport)
 
+
+
+class LazySubresourceTest(unittest.TestCase):
+
+    def setUp(self):
+        self.parent = ListResource(base_uri, auth)
+        self.parent.instance = Call
+
+    def testNotLoadedEagerly(self):
+        call = self.parent.load_instance({"sid": "CA123"})
+        self.assertFalse("recordings" in call.__dict__)
+        self.assertFalse("notifications" in call.__dict__)
+
+    def testLoadedOnAccess(self):
+        call = self.parent.load_instance({"sid": "CA123"})
+        recordings = call.recordings
+
+        self.assertIsInstance(recordings, Recordings)
+        self.assertEquals(recordings.uri, "%s/Recordings" % call.uri)
+        self.assertTrue(call.recordings is recordings)
+        self.assertTrue(call.__dict__["recordings"] is recordings)
+
+    def testMissingAttribute(self):
+        call = self.parent.load_instance({"sid": "CA123"})
+        self.assertRaises(AttributeError, getattr, call, "foo")
+
+    def testEquivalence(self):
+        r1 = self.parent.load_instance({"sid": "CA123"})
+        r2 = self.parent.load_instance({"sid": "CA123"})
+        r1.recordings
+        self.assertEquals(r1, r2)
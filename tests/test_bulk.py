@@ -0,0 +1,183 @@
+import json
+import socket
+import threading
+import time
+from mock import patch, Mock
+from nose.tools import assert_equals, assert_true
+from twilio import TwilioRestException
+from twilio.rest.resources import Call
+from twilio.rest.resources import Calls
+from twilio.rest.resources import RetryPolicy
+from twilio.rest.resources import SmsMessages
+from twilio.rest.resources import SmsMessage
+from twilio.rest.resources import TokenBucket
+from twilio.rest.resources import Transport
+from twilio.rest.resources import map_concurrently
+
+BASE_URI = "https://api.twilio.com/2010-04-01/Accounts/AC123"
+AUTH = ("AC123", "token")
+
+
+def created(method, uri, data=None, **kwargs):
+    if data["To"] == "bad":
+        raise TwilioRestException(400, uri, "21211: Invalid 'To' number")
+
+    resp = Mock()
+    resp.status_code = 201
+    resp.content = json.dumps({"sid": "SM" + data["To"], "body": data["Body"]})
+    return resp
+
+
+@patch("twilio.rest.resources.make_twilio_request")
+def test_sms_create_many(mock):
+    mock.side_effect = created
+    messages = SmsMessages(BASE_URI + "/SMS", AUTH)
+
+    requests = [
+        ("1", "+15555555555", "Hello"),
+        ("bad", "+15555555555", "Hello"),
+        {"to": "2", "from_": "+15555555555", "body": "Hi",
+         "status_callback": "http://example.com"},
+        ]
+    results = list(messages.create_many(iter(requests), workers=2))
+
+    assert_equals(len(results), 3)
+    by_request = dict((str(r.request), r) for r in results)
+
+    ok = by_request[str(requests[0])]
+    assert_true(isinstance(ok.instance, SmsMessage))
+    assert_equals(ok.instance.sid, "SM1")
+    assert_equals(ok.error, None)
+
+    failed = by_request[str(requests[1])]
+    assert_equals(failed.instance, None)
+    assert_equals(failed.error.status, 400)
+
+    assert_equals(by_request[str(requests[2])].instance.sid, "SM2")
+    mock.assert_any_call("POST", BASE_URI + "/SMS/Messages", auth=AUTH,
+                         data={"To": "2", "From": "+15555555555",
+                               "Body": "Hi",
+                               "StatusCallback": "http://example.com"})
+
+
+def test_map_concurrently_bounded():
+    running = []
+    peak = []
+    lock = threading.Lock()
+
+    def work(i):
+        with lock:
+            running.append(i)
+            peak.append(len(running))
+        time.sleep(0.01)
+        with lock:
+            running.remove(i)
+        return i * 2
+
+    results = [f.result() for i, f in map_concurrently(work, xrange(20), 3)]
+
+    assert_equals(sorted(results), [i * 2 for i in range(20)])
+    assert_true(max(peak) <= 3)
+
+
+def test_map_concurrently_lazy():
+    consumed = []
+
+    def items():
+        for i in range(1000):
+            consumed.append(i)
+            yield i
+
+    results = map_concurrently(lambda i: i, items(), 2)
+    results.next()
+    assert_true(len(consumed) <= 3)
+    results.close()
+
+
+def dial(method, uri, data=None, **kwargs):
+    if data["To"] == "lost":
+        dial.lost += 1
+        raise socket.error("Connection reset by peer")
+
+    resp = Mock(ok=True, status_code=201, url=uri)
+    resp.content = json.dumps({"sid": "CA" + data["To"]})
+
+    if data["To"] == "busy":
+        dial.throttled += 1
+        if dial.throttled < 3:
+            resp.ok, resp.status_code = False, 429
+            resp.content = '{"code": 20429, "message": "Too Many Requests"}'
+    if data["To"] == "bad":
+        resp.ok, resp.status_code = False, 400
+        resp.content = '{"code": 21211, "message": "Invalid To number"}'
+
+    return resp
+
+
+def dialer(limiter=None):
+    dial.throttled = 0
+    dial.lost = 0
+    transport = Transport(AUTH, retry=RetryPolicy(), limiter=limiter)
+    transport.request = Mock(side_effect=dial)
+    return Calls(BASE_URI, AUTH, transport)
+
+
+@patch("twilio.rest.resources.time.sleep")
+def test_calls_create_many(sleep):
+    limiter = Mock()
+    calls = dialer(limiter)
+
+    requests = [
+        ("1", "+15555555555", "http://example.com"),
+        ("busy", "+15555555555", "http://example.com"),
+        ("bad", "+15555555555", "http://example.com"),
+        ("lost", "+15555555555", "http://example.com"),
+        ]
+    results = dict((r.request[0], r) for r in
+                   calls.create_many(requests, workers=2))
+
+    assert_true(isinstance(results["1"].instance, Call))
+    assert_equals(results["busy"].instance.sid, "CAbusy")
+    assert_equals(dial.throttled, 3)
+    assert_equals(results["bad"].error.status, 400)
+
+    # A call that may have been placed is never sent twice
+    assert_true(isinstance(results["lost"].error, socket.error))
+    assert_equals(dial.lost, 1)
+
+    # Every attempt waits on the client's rate limiter
+    assert_equals(limiter.acquire.call_count, 6)
+    limiter.acquire.assert_called_with("POST", Calls, None)
+    assert_equals(limiter.throttled.call_count, 2)
+
+
+@patch("twilio.rest.resources.time.sleep")
+def test_calls_create_many_gives_up(sleep):
+    calls = dialer()
+    dial.throttled = -10
+
+    requests = [("busy", "+15555555555", "http://example.com")]
+    results = list(calls.create_many(requests,
+                                     retry=RetryPolicy(attempts=3)))
+
+    # A policy without POST sends each call once, and the client's own
+    # policy is restored afterwards
+    assert_equals(results[0].error.status, 429)
+    assert_equals(dial.throttled, -9)
+    assert_equals(calls.transport.get_retry().methods, ("GET", "DELETE"))
+
+    results = list(calls.create_many(requests, retry=RetryPolicy(
+        attempts=3, methods=("POST",))))
+    assert_equals(results[0].error.status, 429)
+    assert_equals(dial.throttled, -6)
+
+
+def test_token_bucket():
+    bucket = TokenBucket(100, capacity=1)
+    start = time.time()
+    for i in range(6):
+        bucket.acquire()
+    elapsed = time.time() - start
+
+    assert_true(elapsed >= 0.04)
+    assert_true(elapsed < 1)
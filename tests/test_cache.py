@@ -0,0 +1,177 @@
+import os
+import tempfile
+from mock import patch
+from nose.tools import assert_equals, assert_true
+from tools import mock_response
+from tools import mock_transport
+from twilio.rest.resources import Calls
+from twilio.rest.resources import CallerIds
+from twilio.rest.resources import FileCache
+from twilio.rest.resources import LRUCache
+
+BASE_URI = "https://api.twilio.com/2010-04-01/Accounts/AC123"
+AUTH = ("AC123", "token")
+URI = BASE_URI + "/OutgoingCallerIds/PN123"
+
+
+def cached_transport(*responses):
+    return mock_transport(*responses, auth=AUTH, cache=LRUCache(ttl=60))
+
+
+def ok(headers=None):
+    path = "tests/resources/outgoing_caller_ids_instance.json"
+    return mock_response(200, open(path).read(), headers)
+
+
+def test_lru_eviction():
+    cache = LRUCache(max_size=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert_equals(cache.get("a"), 1)
+    assert_equals(cache.get("b"), None)
+    assert_equals(cache.get("c"), 3)
+    assert_equals(len(cache), 2)
+
+
+@patch("twilio.rest.resources.time")
+def test_lru_ttl(mock_time):
+    mock_time.time.return_value = 100
+    cache = LRUCache()
+    cache.set("a", 1, 10)
+    assert_equals(cache.get("a"), 1)
+
+    mock_time.time.return_value = 110
+    assert_equals(cache.get("a"), None)
+    assert_equals(len(cache), 0)
+
+
+def test_cached_get():
+    transport = cached_transport(ok())
+    resource = CallerIds(BASE_URI, AUTH, transport)
+
+    first = resource.get("PN123")
+    second = resource.get("PN123")
+
+    assert_equals(transport.request.call_count, 1)
+    assert_equals(first.sid, second.sid)
+    assert_true(first is not second)
+
+
+def test_uncacheable_resource():
+    transport = cached_transport(ok(), ok())
+    resource = Calls(BASE_URI, AUTH, transport)
+
+    resource.get("PN123")
+    resource.get("PN123")
+
+    assert_equals(transport.request.call_count, 2)
+
+
+@patch("twilio.rest.resources.time")
+def test_revalidate_etag(mock_time):
+    not_modified = mock_response(304, "")
+    transport = cached_transport(ok({"etag": '"abc"'}), not_modified)
+    resource = CallerIds(BASE_URI, AUTH, transport)
+
+    mock_time.time.return_value = 100
+    resource.get("PN123")
+
+    mock_time.time.return_value = 200
+    caller_id = resource.get("PN123")
+
+    assert_equals(caller_id.sid, "PN947e73eded59a5733d2c1c1c69a83a28")
+    args, kwargs = transport.request.call_args
+    assert_equals(kwargs["headers"]["If-None-Match"], '"abc"')
+
+    # The 304 makes the entry fresh again
+    resource.get("PN123")
+    assert_equals(transport.request.call_count, 2)
+
+
+@patch("twilio.rest.resources.time")
+def test_file_cache_prunes_revalidatable(mock_time):
+    transport = cached_transport(ok({"etag": '"abc"'}))
+    transport.cache = FileCache(os.path.join(tempfile.mkdtemp(), "cache"),
+                                ttl=60, stale_ttl=100)
+    resource = CallerIds(BASE_URI, AUTH, transport)
+
+    mock_time.time.return_value = 100
+    resource.get("PN123")
+
+    mock_time.time.return_value = 259
+    transport.cache.prune()
+    assert_true(transport.cache.get(URI) is not None)
+
+    mock_time.time.return_value = 260
+    transport.cache.prune()
+    with transport.cache.open() as db:
+        assert_equals(db.keys(), [])
+
+
+def test_update_invalidates():
+    transport = cached_transport(ok(), ok(), ok())
+    resource = CallerIds(BASE_URI, AUTH, transport)
+
+    resource.get("PN123")
+    resource.update("PN123", friendly_name="Test")
+    resource.get("PN123")
+
+    assert_equals(transport.request.call_count, 3)
+
+
+def test_delete_invalidates():
+    deleted = mock_response(204, "")
+    transport = cached_transport(ok(), deleted, ok())
+    resource = CallerIds(BASE_URI, AUTH, transport)
+
+    resource.get("PN123")
+    resource.delete("PN123")
+    resource.get("PN123")
+
+    assert_equals(transport.request.call_count, 3)
+    assert_equals(transport.cache.get(URI)["item"]["sid"],
+                  "PN947e73eded59a5733d2c1c1c69a83a28")
+
+
+def test_file_cache_shared():
+    path = os.path.join(tempfile.mkdtemp(), "cache")
+    first = FileCache(path)
+    second = FileCache(path)
+
+    first.set(URI, {"sid": "PN123"})
+    assert_equals(second.get(URI), {"sid": "PN123"})
+
+    second.delete(URI)
+    assert_equals(first.get(URI), None)
+
+
+@patch("twilio.rest.resources.time")
+def test_file_cache_ttl(mock_time):
+    cache = FileCache(os.path.join(tempfile.mkdtemp(), "cache"))
+
+    mock_time.time.return_value = 100
+    cache.set("a", 1, 10)
+    cache.set("b", 2)
+    assert_equals(cache.get("a"), 1)
+
+    mock_time.time.return_value = 110
+    assert_equals(cache.get("a"), None)
+
+    cache.prune()
+    with cache.open() as db:
+        assert_equals(db.keys(), ["b"])
+
+
+def test_resource_file_cache():
+    transport = cached_transport(ok())
+    transport.cache = FileCache(os.path.join(tempfile.mkdtemp(), "cache"))
+    resource = CallerIds(BASE_URI, AUTH, transport)
+
+    resource.get("PN123")
+    caller_id = resource.get("PN123")
+
+    assert_equals(transport.request.call_count, 1)
+    assert_equals(caller_id.friendly_name, "(415) 867-5309")
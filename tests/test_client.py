@@ -1,4 +1,34 @@
+import subprocess
+import sys
+from nose.tools import assert_equals, assert_false, assert_true, raises
 from twilio.rest import TwilioRestClient
+from twilio.rest.resources import Calls
 
 def test_client_init():
     twilio = TwilioRestClient("AC123", "SECRET")
+
+
+def test_lazy_resources():
+    client = TwilioRestClient("AC123", "SECRET")
+    assert_false("calls" in client.__dict__)
+
+    calls = client.calls
+    assert_true(isinstance(calls, Calls))
+    assert_true(client.calls is calls)
+    assert_true(calls.transport is client.transport)
+    assert_equals(calls.uri,
+                  "https://api.twilio.com/2010-04-01/Accounts/AC123/Calls")
+    assert_equals(client.accounts.uri,
+                  "https://api.twilio.com/2010-04-01/Accounts")
+
+
+@raises(AttributeError)
+def test_unknown_resource():
+    TwilioRestClient("AC123", "SECRET").faxes
+
+
+def test_import_is_lazy():
+    code = ("import sys, twilio.rest; "
+            "sys.exit(any(m in sys.modules for m in "
+            "('httplib', 'httplib2', 'twilio.contrib.httplib2')))")
+    assert_equals(subprocess.call([sys.executable, "-c", code]), 0)
@@ -0,0 +1,134 @@
+import json
+import time
+from datetime import date
+from mock import patch, Mock
+from nose.tools import assert_equals, raises
+from twilio import TwilioException
+from twilio import TwilioRestException
+from twilio.rest.resources import Calls
+from twilio.rest.resources import Recordings
+from twilio.rest.resources import SmsMessages
+from twilio.rest.resources import chain_concurrently
+from twilio.rest.resources import date_windows
+
+BASE_URI = "https://api.twilio.com/2010-04-01/Accounts/AC123"
+AUTH = ("AC123", "token")
+
+
+def fake_pages(key, after, before):
+    """
+    Return one page per day, with a record sid named after the day
+    """
+    def request(method, uri, params=None, **kwargs):
+        assert_equals(params[after], params[before])
+        resp = Mock()
+        resp.content = json.dumps({
+            key: [{"sid": params[after]}],
+            "next_page_uri": None,
+            })
+        return resp
+    return request
+
+
+def test_date_windows():
+    windows = date_windows("2011-01-01", date(2011, 1, 5), days=2)
+    assert_equals(windows, [
+        (date(2011, 1, 5), date(2011, 1, 5)),
+        (date(2011, 1, 3), date(2011, 1, 4)),
+        (date(2011, 1, 1), date(2011, 1, 2)),
+        ])
+
+
+def test_date_windows_empty():
+    assert_equals(date_windows("2011-01-02", "2011-01-01"), [])
+
+
+@raises(ValueError)
+def test_date_windows_zero_days():
+    date_windows("2011-01-01", "2011-01-03", 0)
+
+
+@raises(ValueError)
+def test_export_zero_days():
+    Calls(BASE_URI, AUTH).export("2011-01-01", "2011-01-03", days=0)
+
+
+@patch("twilio.rest.resources.make_twilio_request")
+def test_export_calls_ordered(mock):
+    mock.side_effect = fake_pages("calls", "StartTime>", "StartTime<")
+    calls = Calls(BASE_URI, AUTH)
+
+    sids = [c.sid for c in calls.export("2011-01-01", "2011-01-04",
+                                        workers=3)]
+
+    assert_equals(sids, ["2011-01-04", "2011-01-03", "2011-01-02",
+                         "2011-01-01"])
+
+
+@patch("twilio.rest.resources.make_twilio_request")
+def test_export_sms_unordered(mock):
+    mock.side_effect = fake_pages("sms_messages", "DateSent>", "DateSent<")
+    messages = SmsMessages(BASE_URI + "/SMS", AUTH)
+
+    sids = [m.sid for m in messages.export(date(2011, 1, 1),
+                                           date(2011, 1, 3), ordered=False)]
+
+    assert_equals(sorted(sids), ["2011-01-01", "2011-01-02", "2011-01-03"])
+
+
+@patch("twilio.rest.resources.make_twilio_request")
+def test_export_passes_filters(mock):
+    mock.side_effect = fake_pages("calls", "StartTime>", "StartTime<")
+    calls = Calls(BASE_URI, AUTH)
+
+    list(calls.export("2011-01-01", "2011-01-01", status="completed",
+                      page_size=1000))
+
+    exp_params = {
+        "StartTime>": "2011-01-01",
+        "StartTime<": "2011-01-01",
+        "Status": "completed",
+        "PageSize": 1000,
+        }
+    mock.assert_called_with("GET", "%s/Calls" % BASE_URI, auth=AUTH,
+                            params=exp_params)
+
+
+@raises(TwilioException)
+def test_export_unsupported():
+    Recordings(BASE_URI, AUTH).export("2011-01-01", "2011-01-02")
+
+
+@raises(TwilioRestException)
+def test_chain_concurrently_error():
+    def fail():
+        raise TwilioRestException(500, "uri")
+        yield
+
+    list(chain_concurrently([lambda: [1, 2], fail], ordered=False))
+
+
+def test_chain_concurrently_ordered():
+    sources = [lambda i=i: range(i * 10, i * 10 + 3) for i in range(5)]
+    items = list(chain_concurrently(sources, workers=2))
+    assert_equals(items, [0, 1, 2, 10, 11, 12, 20, 21, 22, 30, 31, 32,
+                          40, 41, 42])
+
+
+def test_chain_concurrently_ordered_bounded():
+    produced = []
+
+    def source(i):
+        for j in range(1000):
+            produced.append(j)
+            yield i * 1000 + j
+
+    sources = [lambda i=i: source(i) for i in range(20)]
+    items = chain_concurrently(sources, workers=4)
+    assert_equals(items.next(), 0)
+    time.sleep(0.5)
+
+    # The first source runs ahead by a queue's worth, and the three other
+    # workers each fill one queue
+    assert len(produced) < 50
+    items.close()
@@ -0,0 +1,203 @@
+import socket
+import unittest
+from mock import Mock
+from nose.tools import assert_equals, assert_true, raises
+from tools import TwilioServer
+from tools import mock_response
+from tools import mock_transport
+from twilio import TwilioException
+from twilio import TwilioRestException
+from twilio.rest import TwilioRestClient
+from twilio.rest.resources import Calls
+from twilio.rest.resources import Hooks
+from twilio.rest.resources import RequestEvent
+from twilio.rest.resources import RequestStats
+from twilio.rest.resources import RetryPolicy
+from twilio.rest.resources import Timings
+from twilio.rest.resources import httplib2
+from twilio.rest.resources import make_twilio_request
+from twilio.rest.resources import timer_running
+
+
+def response(status, content="{}"):
+    return mock_response(status, content, timings=Timings(0.0, 0.1, 0.2))
+
+
+def recorded(*responses, **kwargs):
+    transport = mock_transport(*responses, **kwargs)
+    events = []
+
+    for name in Hooks.events:
+        transport.hooks.add(name, lambda e, name=name: events.append((name,
+                                                                      e)))
+    return transport, events
+
+
+def send(transport):
+    return make_twilio_request("GET", "http://random/url",
+                               transport=transport, resource=Calls)
+
+
+def test_hooks_success():
+    transport, events = recorded(response(200, '{"sid": "CA1"}'))
+    send(transport)
+
+    assert_equals([name for name, e in events],
+                  ["before_request", "after_response"])
+    event = events[1][1]
+    assert_equals(event.method, "GET")
+    assert_equals(event.resource, Calls)
+    assert_equals(event.uri, "http://random/url.json")
+    assert_equals(event.status, 200)
+    assert_equals(event.bytes, 14)
+    assert_equals(event.timings, Timings(0.0, 0.1, 0.2))
+    assert_equals(event.error, None)
+
+
+def test_hooks_retry_and_error():
+    retry = RetryPolicy(attempts=2, backoff=0)
+    transport, events = recorded(response(503), response(503), retry=retry)
+
+    try:
+        send(transport)
+    except TwilioRestException:
+        pass
+
+    assert_equals([name for name, e in events],
+                  ["before_request", "after_response", "on_retry",
+                   "before_request", "after_response", "on_error"])
+    assert_equals([e.attempt for name, e in events], [0, 0, 0, 1, 1, 1])
+    assert_equals(events[5][1].error.status, 503)
+
+
+def test_hooks_connection_error():
+    error = socket.error("refused")
+    transport, events = recorded(error)
+
+    try:
+        send(transport)
+    except socket.error:
+        pass
+
+    assert_equals([name for name, e in events],
+                  ["before_request", "on_error"])
+    event = events[1][1]
+    assert_equals(event.status, None)
+    assert_true(event.error is error)
+    assert_true(event.timings.total >= 0)
+
+
+def test_hooks_any_error():
+    for error in [TwilioException("No connection was released"),
+                  httplib2.RedirectLimit("loop", None, None)]:
+        transport, events = recorded(error, retry=RetryPolicy(backoff=0))
+        stats = RequestStats()
+        stats.attach(transport.hooks)
+
+        try:
+            send(transport)
+        except type(error):
+            pass
+
+        assert_equals(transport.request.call_count, 1)
+        assert_equals([name for name, e in events],
+                      ["before_request", "on_error"])
+        assert_true(events[1][1].error is error)
+        assert_equals(stats.snapshot()["Calls"]["errors"], 1)
+
+
+def test_hooks_limiter_deadline():
+    limiter = Mock()
+    limiter.acquire.return_value = False
+    transport, events = recorded(response(200), limiter=limiter)
+
+    try:
+        make_twilio_request("GET", "http://random/url", transport=transport,
+                            resource=Calls, deadline=1)
+    except TwilioException:
+        pass
+
+    assert_equals(transport.request.call_count, 0)
+    assert_equals([name for name, e in events], ["on_error"])
+    assert_true("rate limiter" in str(events[0][1].error))
+
+
+def test_hook_errors_ignored():
+    transport, events = recorded(response(200))
+    transport.hooks.add("after_response", Mock(side_effect=ValueError))
+    send(transport)
+    assert_equals(len(events), 2)
+
+
+@raises(ValueError)
+def test_unknown_hook():
+    Hooks().add("on_success", Mock())
+
+
+def test_request_stats():
+    stats = RequestStats(buckets=(0.1, 1))
+
+    def event(status, total=None, resource=Calls):
+        timings = Timings(0, 0, total) if total is not None else None
+        return RequestEvent("GET", resource, "/", 0, status, 0, timings, None)
+
+    stats.record(event(200, 0.05))
+    stats.record(event(200, 0.5))
+    stats.record(event(500, 5))
+    stats.record_failure(event(500, 5))
+    stats.record_failure(event(None))
+    stats.record(event(200, 0.05, resource=None))
+
+    snapshot = stats.snapshot()
+    calls = snapshot["Calls"]
+    assert_equals(calls["requests"], 4)
+    assert_equals(calls["errors"], 2)
+    assert_equals(calls["error_rate"], 0.5)
+    assert_equals(calls["latency_histogram"], [(0.1, 1), (1, 1), (None, 1)])
+    assert_equals(snapshot[None]["requests"], 1)
+
+    stats.reset()
+    assert_equals(stats.snapshot(), {})
+
+
+class ConnectionTimingsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.server = TwilioServer()
+        self.server.start()
+        self.client = TwilioRestClient("AC123", "token", base=self.server.base)
+
+    def tearDown(self):
+        self.client.close()
+        self.server.stop()
+
+    def test_timings(self):
+        events = []
+        self.client.hooks.add("after_response", events.append)
+        stats = RequestStats()
+        stats.attach(self.client.hooks)
+
+        self.client.sms.messages.list()
+        self.client.sms.messages.list()
+
+        first, second = [e.timings for e in events]
+        assert_true(first.connect > 0)
+        assert_equals(second.connect, 0)
+        assert_true(0 < first.first_byte <= first.total)
+        assert_equals(events[0].status, 200)
+        assert_equals(stats.snapshot()["SmsMessages"]["requests"], 2)
+
+    def test_untimed_without_hooks(self):
+        transport = self.client.transport
+        url = "%s/SMS/Messages.json" % self.client.account_uri
+
+        resp = transport.request("GET", url)
+        self.assertEquals(resp.timings, None)
+        self.assertFalse(timer_running())
+
+        # The kept-alive connection is timed once a hook is added
+        self.client.hooks.add("after_response", lambda event: None)
+        resp = transport.request("GET", url)
+        self.assertEquals(resp.timings.connect, 0)
+        self.assertTrue(0 < resp.timings.first_byte <= resp.timings.total)
+        self.assertFalse(timer_running())
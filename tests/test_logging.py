@@ -0,0 +1,79 @@
+import logging
+from mock import patch
+from nose.tools import assert_equals, assert_true, raises
+from tools import mock_response
+from tools import mock_transport
+from twilio import TwilioException
+from twilio.rest.resources import Calls
+from twilio.rest.resources import logger
+from twilio.rest.resources import make_twilio_request
+
+
+class RecordHandler(logging.Handler):
+
+    def __init__(self):
+        logging.Handler.__init__(self)
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+def send(transport, level=logging.DEBUG):
+    handler = RecordHandler()
+    previous = logger.level
+    logger.addHandler(handler)
+    logger.setLevel(level)
+
+    try:
+        make_twilio_request("GET", "http://random/url", transport=transport,
+                            resource=Calls)
+    finally:
+        logger.removeHandler(handler)
+        logger.setLevel(previous)
+
+    return handler.records
+
+
+def test_log_response():
+    records = send(mock_transport(mock_response(content="x" * 100)))
+
+    assert_equals(len(records), 1)
+    record = records[0]
+    assert_equals(record.method, "GET")
+    assert_equals(record.uri, "http://random/url.json")
+    assert_equals(record.status, 200)
+    assert_equals(record.bytes, 100)
+    assert_equals(record.resource, "Calls")
+    assert_true(record.latency >= 0)
+    assert_true("x" not in record.getMessage())
+
+
+def test_log_truncated_body():
+    records = send(mock_transport(mock_response(content="x" * 100),
+                                  body_log_limit=10))
+
+    assert_equals(len(records), 2)
+    assert_equals(records[1].getMessage(),
+                  "Response body: xxxxxxxxxx... (90 bytes truncated)")
+
+
+@patch("twilio.rest.resources.log_response")
+def test_no_logging_above_debug(mock):
+    records = send(mock_transport(mock_response(content="x" * 100)),
+                   level=logging.INFO)
+
+    assert_equals(records, [])
+    assert_equals(mock.call_count, 0)
+
+
+@raises(TwilioException)
+@patch("twilio.rest.resources.logger")
+def test_log_failure(logger):
+    transport = mock_transport(TwilioException("pool timeout"))
+
+    try:
+        make_twilio_request("GET", "http://random/url", transport=transport)
+    finally:
+        message = logger.debug.call_args[0][0]
+        assert_true(message.startswith("%s %s failed after"))
@@ -54,6 +54,8 @@ def test_make_twilio_request_headers(mock):
 def test_make_twilio_request_bad_data(mock):
     resp = Mock()
     resp.ok = False
+    resp.status_code = 400
+    resp.content = ""
     mock.return_value = resp
 
     url = "http://random/url"
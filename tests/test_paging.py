@@ -0,0 +1,211 @@
+import json
+import time
+from datetime import datetime
+from mock import patch, Mock
+from nose.tools import assert_equals, assert_true, raises
+from twilio import TwilioException
+from twilio import TwilioRestException
+from twilio.rest.resources import AvailablePhoneNumbers
+from twilio.rest.resources import Call
+from twilio.rest.resources import Calls
+from twilio.rest.resources import ListResource
+from twilio.rest.resources import prefetch_iter
+from tools import create_mock_json
+
+BASE_URI = "https://api.twilio.com/2010-04-01/Accounts/AC123"
+AUTH = ("AC123", "token")
+NEXT_PAGE = "/2010-04-01/Accounts/AC123/Calls.json?Page=1&PageSize=2"
+
+calls = Calls(BASE_URI, AUTH)
+
+
+def page(sids, next_page_uri=None):
+    resp = Mock()
+    resp.content = json.dumps({
+        "calls": [{"sid": sid} for sid in sids],
+        "next_page_uri": next_page_uri,
+        })
+    return resp
+
+
+@patch("twilio.rest.resources.make_twilio_request")
+def test_iter_follows_next_page_uri(mock):
+    mock.side_effect = [page(["CA1", "CA2"], NEXT_PAGE), page(["CA3"])]
+
+    sids = [c.sid for c in calls.iter(page_size=2, status="completed")]
+
+    assert_equals(sids, ["CA1", "CA2", "CA3"])
+    assert_equals(mock.call_count, 2)
+    mock.assert_any_call("GET", "%s/Calls" % BASE_URI, auth=AUTH,
+                         params={"PageSize": 2, "Status": "completed"})
+    mock.assert_called_with("GET", "https://api.twilio.com" + NEXT_PAGE,
+                            auth=AUTH,
+                            headers={"Accept": "application/json"})
+
+
+@patch("twilio.rest.resources.make_twilio_request")
+def test_iter_is_lazy(mock):
+    mock.side_effect = [page(["CA1", "CA2"], NEXT_PAGE), page(["CA3"])]
+
+    it = calls.iter()
+    assert_equals(mock.call_count, 0)
+    assert_equals(it.next().sid, "CA1")
+    assert_equals(it.next().sid, "CA2")
+    assert_equals(mock.call_count, 1)
+
+
+@patch("twilio.rest.resources.make_twilio_request")
+def test_iter_limit(mock):
+    mock.side_effect = [page(["CA1", "CA2"], NEXT_PAGE), page(["CA3"])]
+
+    sids = [c.sid for c in calls.iter(limit=2)]
+
+    assert_equals(sids, ["CA1", "CA2"])
+    assert_equals(mock.call_count, 1)
+
+
+@raises(TwilioException)
+@patch("twilio.rest.resources.make_twilio_request")
+def test_iter_missing_key(mock):
+    resp = Mock()
+    resp.content = json.dumps({"next_page_uri": None})
+    mock.return_value = resp
+
+    list(calls.iter())
+
+
+@patch("twilio.rest.resources.make_twilio_request")
+def test_iter_prefetch(mock):
+    mock.side_effect = [page(["CA1", "CA2"], NEXT_PAGE), page(["CA3"])]
+
+    sids = [c.sid for c in calls.iter(prefetch=2)]
+
+    assert_equals(sids, ["CA1", "CA2", "CA3"])
+    assert_equals(mock.call_count, 2)
+
+
+@patch("twilio.rest.resources.make_twilio_request")
+def test_iter_prefetch_reads_ahead(mock):
+    mock.side_effect = [page(["CA1"], NEXT_PAGE), page(["CA2"])]
+
+    it = calls.iter(prefetch=1)
+    assert_equals(it.next().sid, "CA1")
+
+    for i in range(50):
+        if mock.call_count == 2:
+            break
+        time.sleep(0.01)
+
+    assert_equals(mock.call_count, 2)
+    it.close()
+
+
+@raises(TwilioRestException)
+@patch("twilio.rest.resources.make_twilio_request")
+def test_iter_prefetch_error(mock):
+    error = TwilioRestException(500, "%s/Calls" % BASE_URI)
+    mock.side_effect = [page(["CA1"], NEXT_PAGE), error]
+
+    list(calls.iter(prefetch=1))
+
+
+def test_prefetch_iter_stops_producer():
+    produced = []
+
+    def numbers():
+        for i in range(100):
+            produced.append(i)
+            yield i
+
+    it = prefetch_iter(numbers(), 1)
+    assert_equals(it.next(), 0)
+    it.close()
+    time.sleep(0.3)
+
+    assert_true(len(produced) < 5)
+
+
+@patch("twilio.rest.resources.make_twilio_request")
+def test_count(mock):
+    resp = create_mock_json("tests/resources/calls_list.json")
+    mock.return_value = resp
+
+    assert_equals(calls.count(status="in-progress"), 509)
+
+    exp_params = {"PageSize": 1, "Status": "in-progress"}
+    mock.assert_called_with("GET", "%s/Calls" % BASE_URI, auth=AUTH,
+                            params=exp_params)
+
+
+@patch("twilio.rest.resources.make_twilio_request")
+def test_count_without_list(mock):
+    resp = create_mock_json("tests/resources/calls_list.json")
+    mock.return_value = resp
+
+    resource = ListResource(BASE_URI, AUTH)
+    assert_equals(resource.count(), 509)
+
+    mock.assert_called_with("GET", "%s/Resources" % BASE_URI, auth=AUTH,
+                            params={"PageSize": 1})
+
+
+@patch("twilio.rest.resources.make_twilio_request")
+def test_count_unfiltered_list(mock):
+    resp = create_mock_json("tests/resources/calls_list.json")
+    mock.return_value = resp
+
+    numbers = AvailablePhoneNumbers(BASE_URI, AUTH, None)
+    assert_equals(numbers.count(), 509)
+
+
+@patch("twilio.rest.resources.make_twilio_request")
+def test_count_dates(mock):
+    resp = create_mock_json("tests/resources/calls_list.json")
+    mock.return_value = resp
+
+    calls.count(started_after=datetime(2011, 1, 2, 3, 4))
+    calls.list(started_after=datetime(2011, 1, 2, 3, 4))
+
+    count, listed = [c[1]["params"] for c in mock.call_args_list]
+    assert_equals(count, {"PageSize": 1, "StartTime>": "2011-01-02"})
+    assert_equals(listed, {"StartTime>": "2011-01-02"})
+
+
+@raises(TypeError)
+def test_count_unknown_filter():
+    calls.count(colour="blue")
+
+
+@patch("twilio.rest.resources.make_twilio_request")
+def test_list_compact(mock):
+    resp = create_mock_json("tests/resources/calls_list.json")
+    mock.return_value = resp
+
+    records = calls.list(compact=True)
+
+    assert_equals(len(records), 50)
+    assert_true(isinstance(records[0], tuple))
+    assert_equals(records[0].sid, "CA24388be8ed59a5733d2c1c1c69a83a28")
+    assert_equals(records[0].from_, "+141586753093")
+    assert_equals(records[0]._fields, Call.fields)
+
+
+@patch("twilio.rest.resources.make_twilio_request")
+def test_iter_compact(mock):
+    mock.side_effect = [page(["CA1", "CA2"], NEXT_PAGE), page(["CA3"])]
+
+    records = list(calls.iter(compact=True))
+
+    assert_equals([r.sid for r in records], ["CA1", "CA2", "CA3"])
+    assert_equals(records[0].status, None)
+
+
+@raises(AttributeError)
+def test_record_read_only():
+    record = calls.load_record({"sid": "CA1"})
+    record.sid = "CA2"
+
+
+@raises(TwilioException)
+def test_record_unknown_fields():
+    ListResource(BASE_URI, AUTH).load_record({"sid": "CA1"})
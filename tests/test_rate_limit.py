@@ -0,0 +1,106 @@
+import json
+import time
+from mock import patch, Mock
+from nose.tools import assert_equals, assert_false, assert_true, raises
+from twilio import TwilioException
+from twilio.rest import TwilioRestClient
+from twilio.rest.resources import AdaptiveTokenBucket
+from twilio.rest.resources import Calls
+from twilio.rest.resources import RateLimiter
+from twilio.rest.resources import SmsMessages
+from twilio.rest.resources import Transport
+from twilio.rest.resources import make_twilio_request
+
+
+def test_limiter_budgets():
+    limiter = RateLimiter(rate=10, limits={
+        "Calls": 1,
+        ("SmsMessages", "POST"): 2,
+        "DELETE": 3,
+        })
+
+    assert_equals(limiter.bucket("GET", Calls).rate, 1)
+    assert_equals(limiter.bucket("POST", SmsMessages).rate, 2)
+    assert_equals(limiter.bucket("GET", SmsMessages).rate, 10)
+    assert_equals(limiter.bucket("DELETE", SmsMessages).rate, 3)
+    assert_equals(limiter.bucket("GET").rate, 10)
+
+
+def test_limiter_unlimited():
+    limiter = RateLimiter(limits={"Calls": 1})
+    assert_equals(limiter.bucket("GET", SmsMessages), None)
+    limiter.acquire("GET", SmsMessages)
+
+
+def test_adaptive_bucket():
+    bucket = AdaptiveTokenBucket(10, recovery=0.1)
+
+    bucket.throttle()
+    assert_equals(bucket.rate, 5)
+    assert_true(bucket.tokens <= 0)
+
+    for i in range(10):
+        bucket.throttle()
+    assert_equals(bucket.rate, 0.5)
+
+    bucket.recover()
+    assert_equals(bucket.rate, 1.5)
+
+    for i in range(20):
+        bucket.recover()
+    assert_equals(bucket.rate, 10)
+
+
+def test_bucket_timeout():
+    bucket = AdaptiveTokenBucket(1)
+    assert_true(bucket.acquire(0))
+
+    start = time.time()
+    assert_false(bucket.acquire(0.1))
+    assert_true(time.time() - start < 0.5)
+
+
+@raises(TwilioException)
+def test_deadline_covers_limiter():
+    transport = Transport(limiter=RateLimiter(rate=0.1))
+    transport.request = Mock(return_value=Mock(ok=True, status_code=200,
+                                               content=""))
+
+    make_twilio_request("GET", "http://random/url", transport=transport)
+    make_twilio_request("GET", "http://random/url", transport=transport,
+                        deadline=1)
+
+
+def test_request_adapts_limiter():
+    limiter = Mock()
+    transport = Transport(limiter=limiter)
+    throttled = Mock(ok=False, status_code=429, content="")
+    transport.request = Mock(side_effect=[Mock(ok=True, status_code=200,
+                                               content=""),
+                                          throttled])
+
+    make_twilio_request("GET", "http://random/url", transport=transport,
+                        resource=Calls)
+    limiter.acquire.assert_called_with("GET", Calls, None)
+    limiter.succeeded.assert_called_with("GET", Calls)
+
+    try:
+        make_twilio_request("POST", "http://random/url",
+                            transport=transport, resource=Calls)
+    except Exception:
+        pass
+    limiter.throttled.assert_called_with("POST", Calls)
+
+
+@patch("twilio.rest.resources.Transport.request")
+def test_client_shares_limiter(request):
+    resp = Mock(ok=True, status_code=200)
+    resp.content = json.dumps({"sid": "CA123"})
+    request.return_value = resp
+
+    limiter = Mock()
+    client = TwilioRestClient("AC123", "token", rate_limiter=limiter)
+    assert_true(client.transport.limiter is limiter)
+
+    client.calls.get("CA123")
+    limiter.acquire.assert_called_with("GET", Calls, None)
@@ -0,0 +1,193 @@
+import socket
+from mock import patch, Mock
+from nose.tools import assert_equals, assert_true, raises
+from tools import mock_response
+from tools import mock_transport
+from twilio import TwilioRestException
+from twilio.rest import TwilioRestClient
+from twilio.rest.resources import RetryPolicy
+from twilio.rest.resources import httplib2
+from twilio.rest.resources import make_request
+from twilio.rest.resources import make_twilio_request
+
+
+@patch("twilio.rest.resources.time.sleep")
+def test_retry_get(sleep):
+    retries = []
+    policy = RetryPolicy(attempts=3)
+    t = mock_transport(mock_response(503), socket.error(), mock_response(200),
+                       retry=policy)
+    t.hooks.add("on_retry", retries.append)
+
+    resp = make_twilio_request("GET", "http://random/url", transport=t)
+
+    assert_equals(resp.status_code, 200)
+    assert_equals(t.request.call_count, 3)
+    assert_equals(policy.retries, 2)
+    assert_equals([e.attempt for e in retries], [0, 1])
+    assert_equals(retries[0].error.status, 503)
+    assert_equals(sleep.call_count, 2)
+
+
+@raises(TwilioRestException)
+@patch("twilio.rest.resources.time.sleep")
+def test_retry_gives_up(sleep):
+    policy = RetryPolicy(attempts=2)
+    t = mock_transport(mock_response(500), mock_response(500),
+                       mock_response(200), retry=policy)
+
+    try:
+        make_twilio_request("GET", "http://random/url", transport=t)
+    finally:
+        assert_equals(t.request.call_count, 2)
+
+
+@patch("twilio.rest.resources.time.sleep")
+def test_retry_dns_failure(sleep):
+    error = httplib2.ServerNotFoundError("Unable to find the server")
+    t = mock_transport(error, mock_response(200), retry=RetryPolicy(backoff=0))
+
+    resp = make_twilio_request("GET", "http://random/url", transport=t)
+    assert_equals(resp.status_code, 200)
+    assert_equals(t.request.call_count, 2)
+
+
+@raises(httplib2.SSLHandshakeError)
+def test_no_retry_connection_errors():
+    policy = RetryPolicy(backoff=0, connection_errors=False)
+    t = mock_transport(httplib2.SSLHandshakeError(), mock_response(200),
+                       retry=policy)
+
+    try:
+        make_twilio_request("GET", "http://random/url", transport=t)
+    finally:
+        assert_equals(t.request.call_count, 1)
+
+
+@raises(TwilioRestException)
+def test_no_retry_post():
+    t = mock_transport(mock_response(503), mock_response(201),
+                       retry=RetryPolicy())
+
+    try:
+        make_twilio_request("POST", "http://random/url", transport=t)
+    finally:
+        assert_equals(t.request.call_count, 1)
+
+
+@patch("twilio.rest.resources.time.sleep")
+def test_retry_post_opt_in(sleep):
+    policy = RetryPolicy(methods=("GET", "DELETE", "POST"))
+    t = mock_transport(mock_response(503), mock_response(201), retry=policy)
+
+    resp = make_twilio_request("POST", "http://random/url", transport=t)
+    assert_equals(resp.status_code, 201)
+
+
+@raises(TwilioRestException)
+def test_no_retry_client_error():
+    t = mock_transport(mock_response(404), mock_response(200),
+                       retry=RetryPolicy())
+
+    try:
+        make_twilio_request("GET", "http://random/url", transport=t)
+    finally:
+        assert_equals(t.request.call_count, 1)
+
+
+def test_delay():
+    policy = RetryPolicy(backoff=1, max_backoff=5, jitter=False)
+    assert_equals([policy.delay(a) for a in range(5)], [1, 2, 4, 5, 5])
+
+    policy.jitter = True
+    for attempt in range(5):
+        delay = policy.delay(attempt)
+        assert_true(0 <= delay <= min(5, 2 ** attempt))
+
+
+def test_client_retry_policy():
+    client = TwilioRestClient("AC123", "token")
+    assert_true(isinstance(client.transport.retry, RetryPolicy))
+
+    policy = RetryPolicy(attempts=5)
+    client = TwilioRestClient("AC123", "token", retry=policy)
+    assert_true(client.transport.retry is policy)
+
+
+@patch("twilio.rest.resources.time.sleep")
+def test_timeout_passed_to_transport(sleep):
+    t = mock_transport(mock_response(200), timeout=3)
+
+    make_twilio_request("GET", "http://random/url", transport=t)
+
+    assert_equals(t.request.call_args[1]["timeout"], 3)
+
+
+@raises(TwilioRestException)
+@patch("twilio.rest.resources.time")
+def test_deadline_stops_retries(time):
+    clock = [1000.0]
+    time.time.side_effect = lambda: clock[0]
+    time.sleep.side_effect = lambda delay: clock.__setitem__(0, clock[0] +
+                                                             delay)
+
+    policy = RetryPolicy(attempts=10, backoff=1, jitter=False)
+    t = mock_transport(*([mock_response(503)] * 10), retry=policy)
+
+    try:
+        make_twilio_request("GET", "http://random/url", transport=t,
+                            deadline=2.5)
+    finally:
+        # Waiting 1 second fits in the deadline, waiting 2 more does not
+        assert_equals(t.request.call_count, 2)
+
+
+def test_deadline_bounds_timeout():
+    t = mock_transport(mock_response(200), timeout=30)
+
+    make_twilio_request("GET", "http://random/url", transport=t, deadline=2)
+
+    assert_true(t.request.call_args[1]["timeout"] <= 2)
+
+
+def test_thread_timeouts():
+    client = TwilioRestClient("AC123", "token", timeout=10)
+    transport = client.transport
+
+    with client.timeouts(timeout=1, deadline=5):
+        assert_equals(transport.get_timeout(), 1)
+        assert_equals(transport.get_deadline(), 5)
+
+    assert_equals(transport.get_timeout(), 10)
+    assert_equals(transport.get_deadline(), None)
+
+
+def test_timeouts_on_worker_threads():
+    client = TwilioRestClient("AC123", "token", timeout=10)
+    timeouts = []
+
+    def request(method, uri, **kwargs):
+        timeouts.append(kwargs["timeout"])
+        if method == "POST":
+            return mock_response(201, '{"sid": "CA123"}')
+        return mock_response(200, '{"calls": [{"sid": "CA123"}]}')
+
+    client.transport.request = Mock(side_effect=request)
+
+    with client.timeouts(timeout=2):
+        results = client.calls.create_many([("+1", "+2", "http://a")] * 3)
+        calls = client.calls.iter(prefetch=1)
+        exported = client.calls.export("2012-01-01", "2012-01-02")
+
+    assert_equals(len(list(results)), 3)
+    assert_equals(len(list(calls)), 1)
+    assert_equals(len(list(exported)), 2)
+    assert_equals(timeouts, [2] * 6)
+    assert_equals(client.transport.get_timeout(), 10)
+
+
+@patch("twilio.rest.resources.httplib2.Http")
+def test_make_request_timeout(mock):
+    mock.return_value.request.return_value = (Mock(status=200), "")
+    make_request("GET", "http://random/url", timeout=4)
+    mock.assert_called_with(timeout=4)
@@ -0,0 +1,113 @@
+"""
+Test incremental parsing of list pages
+"""
+import json
+import unittest
+from StringIO import StringIO
+from nose.tools import assert_equals, raises
+from tools import TwilioHandler
+from tools import TwilioServer
+from twilio import TwilioException
+from twilio import TwilioRestException
+from twilio.rest import TwilioRestClient
+from twilio.rest.resources import JsonStream
+
+
+def parse(body, key, chunk_size):
+    fields = {}
+    stream = JsonStream(StringIO(body).read, chunk_size=chunk_size)
+    items = list(stream.iter_items(key, fields))
+    return items, fields
+
+
+def test_parse_fixture():
+    body = open("tests/resources/calls_list.json").read()
+    page = json.loads(body)
+    calls = page.pop("calls")
+
+    for chunk_size in (1, 7, 64, 8192):
+        items, fields = parse(body, "calls", chunk_size)
+        assert_equals(items, calls)
+        assert_equals(fields, page)
+
+
+def test_parse_key_order():
+    body = '{"calls": [{"sid": "CA1"}, {"sid": "CA2"}], "total": 12345}'
+    items, fields = parse(body, "calls", 3)
+    assert_equals(items, [{"sid": "CA1"}, {"sid": "CA2"}])
+    assert_equals(fields, {"total": 12345})
+
+
+def test_parse_empty_list():
+    items, fields = parse(' { "calls" : [ ] , "end": 0 } ', "calls", 2)
+    assert_equals(items, [])
+    assert_equals(fields, {"end": 0})
+
+
+def test_parse_split_numbers():
+    body = '{"calls": [1.5, 2, 3e2], "price": -1.25E+2, "total": 2}'
+
+    # Chunks of 13 end right after "1."
+    for chunk_size in [1, 13] + range(2, len(body) + 1):
+        items, fields = parse(body, "calls", chunk_size)
+        assert_equals(items, [1.5, 2, 300.0])
+        assert_equals(fields, {"price": -125.0, "total": 2})
+
+
+@raises(TwilioException)
+def test_parse_missing_key():
+    parse('{"total": 0}', "calls", 4)
+
+
+@raises(TwilioException)
+def test_parse_truncated():
+    parse('{"calls": [{"sid": "CA1"}, {"si', "calls", 4)
+
+
+PAGES = {
+    "/2010-04-01/Accounts/AC123/Calls.json?PageSize=2": {
+        "calls": [{"sid": "CA1"}, {"sid": "CA2"}],
+        "next_page_uri": "/2010-04-01/Accounts/AC123/Calls.json?Page=1",
+        },
+    "/2010-04-01/Accounts/AC123/Calls.json?Page=1": {
+        "calls": [{"sid": "CA3"}],
+        "next_page_uri": None,
+        },
+    }
+
+
+class PageHandler(TwilioHandler):
+
+    def route(self):
+        try:
+            return 200, json.dumps(PAGES[self.path])
+        except KeyError:
+            return 404, '{"code": 20404, "message": "Not Found"}'
+
+
+class IncrementalIterTest(unittest.TestCase):
+
+    def setUp(self):
+        self.server = TwilioServer(PageHandler)
+        self.server.start()
+        self.client = TwilioRestClient("AC123", "token", base=self.server.base)
+
+    def tearDown(self):
+        self.client.close()
+        self.server.stop()
+
+    def test_iter(self):
+        calls = self.client.calls.iter(page_size=2, incremental=True)
+        assert_equals([c.sid for c in calls], ["CA1", "CA2", "CA3"])
+
+    def test_list(self):
+        calls = self.client.calls.list(page_size=2, incremental=True)
+        assert_equals([c.sid for c in calls], ["CA1", "CA2"])
+
+    def test_error(self):
+        self.assertRaises(TwilioRestException, self.client.sms.messages.list,
+                          incremental=True)
+
+    def test_prefetch(self):
+        calls = self.client.calls.iter(prefetch=1, incremental=True)
+        self.assertRaises(ValueError, list, calls)
@@ -0,0 +1,210 @@
+import threading
+import time
+from mock import patch, Mock
+from nose.tools import assert_equals, assert_true, assert_false, raises
+from twilio import TwilioException
+from twilio.rest import TwilioRestClient
+from twilio.rest.connections import TimedHTTPSConnection
+from twilio.rest.resources import HttpPool
+from twilio.rest.resources import Transport
+from twilio.rest.resources import basic_auth_header
+from twilio.rest.resources import make_twilio_request
+
+AUTH = ("AC123", "token")
+
+
+def mock_http(status=200, content="{}"):
+    http = Mock()
+    http.connections = {}
+    http.request.return_value = (Mock(status=status), content)
+    return http
+
+
+@patch("twilio.rest.resources.httplib2.Http")
+def test_pool_reuses_http(mock):
+    pool = HttpPool(size=2)
+    h1 = pool.acquire()
+    pool.release(h1)
+    h2 = pool.acquire()
+    assert_true(h1 is h2)
+    assert_equals(mock.call_count, 1)
+
+
+@patch("twilio.rest.resources.httplib2.Http")
+def test_pool_adds_credentials(mock):
+    pool = HttpPool(auth=AUTH)
+    http = pool.acquire()
+    http.add_credentials.assert_called_with("AC123", "token")
+
+
+@patch("twilio.rest.resources.httplib2.Http")
+def test_pool_blocks_when_full(mock):
+    pool = HttpPool(size=1)
+    http = pool.acquire()
+    acquired = []
+
+    t = threading.Thread(target=lambda: acquired.append(pool.acquire()))
+    t.start()
+    t.join(0.1)
+    assert_false(acquired)
+
+    pool.release(http)
+    t.join(1)
+    assert_equals(acquired, [http])
+    assert_equals(pool.created, 1)
+
+
+@raises(TwilioException)
+@patch("twilio.rest.resources.httplib2.Http")
+def test_pool_timeout(mock):
+    pool = HttpPool(size=1)
+    pool.acquire()
+    pool.acquire(timeout=0.01)
+
+
+@patch("twilio.rest.resources.httplib2.Http")
+def test_deadline_covers_pool(mock):
+    transport = Transport(AUTH, pool_size=1)
+    transport.pool.acquire()
+
+    start = time.time()
+    try:
+        make_twilio_request("GET", "https://api.twilio.com",
+                            transport=transport, deadline=0.05)
+    except TwilioException:
+        pass
+    else:
+        raise AssertionError("Request waited past its deadline")
+    assert_true(time.time() - start < 1)
+
+
+def test_pool_closes_idle_connections():
+    pool = HttpPool(size=1, idle_timeout=0)
+    http = mock_http()
+    conn = Mock()
+    http.connections = {"https:api.twilio.com": conn}
+    pool.release(http)
+
+    with patch("twilio.rest.resources.time.time") as now:
+        now.return_value = 10 ** 10
+        assert_true(pool.acquire() is http)
+
+    assert_true(conn.close.called)
+    assert_equals(http.connections, {})
+
+
+@raises(ValueError)
+def test_pool_size():
+    HttpPool(size=0)
+
+
+def test_transport_request():
+    transport = Transport(AUTH, preemptive_auth=False)
+    http = mock_http(content='{"sid": "CA123"}')
+    transport.pool.release(http)
+
+    resp = transport.request("GET", "https://api.twilio.com/Calls.json",
+                             params={"To": "123"}, auth=AUTH)
+
+    http.request.assert_called_with(
+        "https://api.twilio.com/Calls.json?To=123", "GET", headers=None,
+        body=None, connection_type=TimedHTTPSConnection)
+    assert_equals(resp.content, '{"sid": "CA123"}')
+    assert_equals(resp.status_code, 200)
+    assert_true(transport.pool.acquire() is http)
+
+
+def test_basic_auth_header():
+    assert_equals(basic_auth_header(AUTH), "Basic QUMxMjM6dG9rZW4=")
+
+
+def test_transport_preemptive_auth():
+    transport = Transport(AUTH)
+    http = mock_http()
+    transport.pool.release(http)
+
+    headers = {"Accept": "application/json"}
+    transport.request("GET", "https://api.twilio.com/Calls.json",
+                      headers=headers)
+
+    exp_headers = {
+        "Accept": "application/json",
+        "Authorization": "Basic QUMxMjM6dG9rZW4=",
+        }
+    http.request.assert_called_with("https://api.twilio.com/Calls.json",
+                                    "GET", headers=exp_headers, body=None,
+                                    connection_type=TimedHTTPSConnection)
+    assert_false(http.add_credentials.called)
+    assert_equals(headers, {"Accept": "application/json"})
+
+
+@patch("twilio.rest.resources.httplib2.Http")
+def test_transport_challenge_auth(mock):
+    transport = Transport(AUTH, preemptive_auth=False)
+    assert_equals(transport.auth_header, None)
+
+    http = transport.pool.acquire()
+    http.add_credentials.assert_called_with("AC123", "token")
+
+
+def test_transport_discards_broken_connection():
+    transport = Transport(AUTH)
+    http = mock_http()
+    conn = Mock()
+    http.connections = {"https:api.twilio.com": conn}
+    http.request.side_effect = IOError
+    transport.pool.release(http)
+
+    try:
+        transport.request("GET", "https://api.twilio.com/Calls.json")
+    except IOError:
+        pass
+
+    assert_true(conn.close.called)
+    assert_true(transport.pool.acquire() is http)
+
+
+def test_make_twilio_request_transport():
+    transport = Transport(AUTH)
+    transport.request = Mock(return_value=Mock(ok=True, status_code=200,
+                                               content=""))
+
+    make_twilio_request("GET", "http://random/url", transport=transport,
+                        auth=AUTH)
+
+    headers = {"User-Agent": "twilio-python", "Accept": "application/json"}
+    transport.request.assert_called_with("GET", "http://random/url.json",
+                                         auth=AUTH, headers=headers)
+
+
+def test_client_shares_transport():
+    client = TwilioRestClient("AC123", "token", pool_size=3)
+    transport = client.transport
+
+    assert_equals(transport.pool.size, 3)
+    assert_true(client.calls.transport is transport)
+    assert_true(client.sms.messages.transport is transport)
+    assert_true(client.phone_numbers.available_phone_numbers.transport
+                is transport)
+    assert_true(client.participants("CF123").transport is transport)
+
+    call = client.calls.load_instance({"sid": "CA123"})
+    assert_true(call.transport is transport)
+    assert_true(call.recordings.transport is transport)
+
+
+def test_transport_sets_timeout():
+    transport = Transport(AUTH, timeout=5)
+    http = mock_http()
+    conn = Mock()
+    http.connections = {"https:api.twilio.com": conn}
+    transport.pool.release(http)
+
+    transport.request("GET", "https://api.twilio.com/Calls.json")
+    assert_equals(http.timeout, 5)
+    conn.sock.settimeout.assert_called_with(5)
+
+    transport.pool.release(transport.pool.acquire())
+    transport.request("GET", "https://api.twilio.com/Calls.json", timeout=1)
+    assert_equals(http.timeout, 1)
+    conn.sock.settimeout.assert_called_with(1)
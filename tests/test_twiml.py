@@ -2,6 +2,9 @@
 import re
 import twilio
 import unittest
+from StringIO import StringIO
+from wsgiref.handlers import SimpleHandler
+from wsgiref import util as wsgi_util
 from twilio import twiml
 from twilio.twiml import TwimlException
 from twilio.twiml import Response
@@ -403,5 +406,269 @@ class TestGather(TwilioTest):
         self.assertRaises(TwimlException, verb.append, twiml.Conference(""))
         self.assertRaises(TwimlException, verb.append, twiml.Sms(""))
 
+class TestRender(TwilioTest):
+
+    def documents(self):
+        r = Response()
+        g = r.gather(action="/digits?a=1&b=2", numDigits=4, finishOnKey="#")
+        g.say(u"Entrez le num\xe9ro <vite> & \"merci\"", voice="woman",
+              language="fr")
+        g.play("http://example.com/hold.mp3", loop=0)
+        g.pause(length=2)
+        r.say("Goodbye", loop=2)
+        yield r
+
+        r = Response()
+        d = r.dial(action="/done", method="POST", timeLimit=30,
+                   callerId="+14155551234")
+        d.number("+14155550000", sendDigits="ww1234")
+        d.conference("Room\n1", muted=True, waitUrl="/wait?x=\"y\"")
+        r.sms("It's <done>", to="+1415", sender="+1510")
+        r.redirect()
+        r.hangup()
+        yield r
+
+        yield Response()
+        yield twiml.Say("")
+        yield twiml.Dial("+1415, +1510")
+
+    def testRenderMatchesToxml(self):
+        for doc in self.documents():
+            self.assertEquals(doc.render(), doc.toxml())
+            self.assertEquals(type(doc.render()), type(doc.toxml()))
+            self.assertEquals(doc.render(xml_declaration=False),
+                              doc.toxml(xml_declaration=False))
+
+    def testWrite(self):
+        for doc in self.documents():
+            out = StringIO()
+            doc.write(out)
+            self.assertEquals(out.getvalue(), doc.toxml())
+
+    def testRenderBadBody(self):
+        self.assertRaises(TypeError, twiml.Say(5).render)
+
+class TestTemplate(TwilioTest):
+
+    def menu(self, action, prompt, timeout):
+        r = Response()
+        g = r.gather(action=action, numDigits=1, timeout=timeout)
+        g.say(prompt)
+        r.redirect(action)
+        return r
+
+    def testRenderMatchesResponse(self):
+        template = twiml.Template(self.menu(twiml.Slot("action"),
+                                            twiml.Slot("prompt"),
+                                            twiml.Slot("timeout")))
+
+        for action, prompt in [("/menu", "Press 1"),
+                               ('/m?a=1&b="2"', u"<Pr\xe9ss> & 1"),
+                               ("/multi\nline", "Press\n1")]:
+            expected = self.menu(action, prompt, 10).render()
+            rendered = template.render(action=action, prompt=prompt,
+                                       timeout=10)
+            self.assertEquals(rendered, expected)
+            self.assertEquals(type(rendered), type(expected))
+
+    def testDialNumber(self):
+        r = Response()
+        r.dial(twiml.Slot("number"), callerId=twiml.Slot("caller"))
+        template = twiml.Template(r, xml_declaration=False)
+
+        self.assertEquals(template.render(number="+1415", caller="+1510"),
+                          '<Response><Dial callerId="+1510">+1415</Dial>'
+                          '</Response>')
+
+    def testEmptyValue(self):
+        template = twiml.Template(twiml.Say(twiml.Slot("text"),
+                                            loop=twiml.Slot("loop")))
+        self.assertEquals(template.render(text="", loop=""),
+                          u'<?xml version="1.0" encoding="utf-8"?>'
+                          u'<Say loop=""></Say>')
+
+    def testMissingValue(self):
+        template = twiml.Template(twiml.Say(twiml.Slot("text")))
+        self.assertRaises(TwimlException, template.render)
+
+    def testBadSlotName(self):
+        self.assertRaises(TwimlException, twiml.Slot, "bad name")
+
+class TestFreeze(TwilioTest):
+
+    def response(self):
+        r = Response()
+        g = r.gather(action="/menu")
+        g.say(u"Caf\xe9 & more")
+        r.play("http://example.com/hold.mp3", loop=0)
+        return r
+
+    def testFrozenOutput(self):
+        r = self.response()
+        self.assertTrue(r.freeze() is r)
+
+        expected = self.response()
+        self.assertEquals(r.render(), expected.render())
+        self.assertEquals(r.toxml(), expected.toxml())
+        self.assertEquals(r.toxml(xml_declaration=False),
+                          expected.toxml(xml_declaration=False))
+        self.assertEquals(str(r), str(expected))
+
+        out = StringIO()
+        r.write(out)
+        self.assertEquals(out.getvalue(), expected.render())
+
+    def testRenderedOnce(self):
+        r = self.response().freeze()
+        self.assertTrue(r.render() is r.render())
+        self.assertTrue(r.toxml() is r.render())
+
+    def testFrozenAppend(self):
+        r = self.response().freeze()
+        self.assertRaises(TwimlException, r.append, twiml.Say("hi"))
+        self.assertRaises(TwimlException, r.hangup)
+        self.assertRaises(TwimlException, r.verbs[0].say, "hi")
+
+    def testFrozenChild(self):
+        r = Response()
+        r.say("Please hold")
+        hold = twiml.Play("http://example.com/hold.mp3").freeze()
+        r.append(hold)
+        self.assertEquals(r.render(xml_declaration=False),
+                          '<Response><Say>Please hold</Say><Play>'
+                          'http://example.com/hold.mp3</Play></Response>')
+
 if __name__ == '__main__':
     unittest.main()
+
+
+class TestVerbSlots(TwilioTest):
+
+    def testNoInstanceDict(self):
+        r = Response()
+        r.dial("+14155550000").number("+14155550001")
+        for verb in [r, r.verbs[0], r.verbs[0].verbs[0]]:
+            self.assertFalse(hasattr(verb, "__dict__"))
+
+    def testSharedNestables(self):
+        self.assertTrue(isinstance(Response.nestables, frozenset))
+        self.assertTrue(Response().nestables is Response().nestables)
+        self.assertEquals(twiml.Say("hi").nestables, frozenset())
+
+    def testLeafVerbs(self):
+        say = twiml.Say("hi")
+        self.assertEquals(len(say.verbs), 0)
+        self.assertRaises(TwimlException, say.append, twiml.Pause())
+
+    def testSender(self):
+        sms = twiml.Sms("hi", sender="+14155550000", to=None)
+        self.assertEquals(sms.attrs, {"from": "+14155550000"})
+
+    def testVerbsList(self):
+        say = twiml.Say("hi")
+        say.verbs.append(twiml.Pause())
+        self.assertEquals(say.render(xml_declaration=False),
+                          "<Say>hi<Pause /></Say>")
+
+
+class TestStreamingResponse(TwilioTest):
+
+    def build(self, r):
+        r.say("Hello & welcome", voice="woman")
+        g = r.gather(action="/menu", numDigits=1)
+        g.say("Press 1")
+        g.pause(length=1)
+        r.dial("+14155550000,+14155550001")
+        r.hangup()
+        return r
+
+    def testOutput(self):
+        out = StringIO()
+        with twiml.StreamingResponse(out) as r:
+            self.build(r)
+        self.assertEquals(out.getvalue(), self.build(Response()).render())
+
+    def testWriteCallable(self):
+        chunks = []
+        r = twiml.StreamingResponse(chunks.append, xml_declaration=False)
+        self.build(r)
+        r.close()
+        self.assertEquals("".join(chunks),
+                          self.build(Response()).render(xml_declaration=False))
+
+    def testWsgi(self):
+        def app(environ, start_response):
+            write = start_response("200 OK",
+                                   [("Content-Type", "application/xml")])
+            with twiml.StreamingResponse(write) as r:
+                r.say(u"Caf\xe9")
+                self.build(r)
+            return []
+
+        environ = {}
+        wsgi_util.setup_testing_defaults(environ)
+        out, errors = StringIO(), StringIO()
+        SimpleHandler(StringIO(), out, errors, environ).run(app)
+
+        expected = Response()
+        expected.say(u"Caf\xe9")
+        self.build(expected)
+
+        self.assertEquals(errors.getvalue(), "")
+        self.assertTrue(out.getvalue().startswith("HTTP/1.0 200 OK"))
+        self.assertTrue(out.getvalue().endswith("\r\n\r\n" +
+                                                expected.render()))
+
+    def testEmpty(self):
+        out = StringIO()
+        with twiml.StreamingResponse(out, xml_declaration=False):
+            pass
+        self.assertEquals(out.getvalue(), "<Response />")
+
+    def testNestedWith(self):
+        out = StringIO()
+        with twiml.StreamingResponse(out, xml_declaration=False) as r:
+            with r.gather(finishOnKey=4) as g:
+                g.say("World")
+        self.assertEquals(out.getvalue(), '<Response><Gather finishOnKey="4">'
+                          '<Say>World</Say></Gather></Response>')
+
+    def testIncremental(self):
+        chunks = []
+        r = twiml.StreamingResponse(chunks.append, buffer_size=100)
+        for i in range(1000):
+            r.say("Entry %d" % i)
+        self.assertTrue(len(chunks) > 1)
+        self.assertTrue(max(len(chunk) for chunk in chunks) < 200)
+        self.assertEquals(len(r.verbs), 0)
+        self.assertTrue(len(r.buffer) < 10)
+        r.close()
+        self.assertTrue("".join(chunks).endswith(
+            "<Say>Entry 999</Say></Response>"))
+
+    def testWrittenVerbsFrozen(self):
+        r = twiml.StreamingResponse(StringIO())
+        g = r.gather()
+        r.say("hi")
+        self.assertRaises(TwimlException, g.say, "too late")
+
+    def testClosed(self):
+        out = StringIO()
+        r = twiml.StreamingResponse(out)
+        r.close()
+        r.close()
+        self.assertRaises(TwimlException, r.say, "hi")
+
+    def testNotNestable(self):
+        r = twiml.StreamingResponse(StringIO())
+        self.assertRaises(TwimlException, r.append, twiml.Number("+1415"))
+
+    def testErrorLeavesOpen(self):
+        out = StringIO()
+        try:
+            with twiml.StreamingResponse(out, buffer_size=0) as r:
+                r.say("hi")
+                raise ValueError
+        except ValueError:
+            pass
+        self.assertFalse(out.getvalue().endswith("</Response>"))
@@ -1,7 +1,106 @@
+import threading
+from BaseHTTPServer import BaseHTTPRequestHandler
+from BaseHTTPServer import HTTPServer
+from SocketServer import ThreadingMixIn
 from mock import Mock
+from twilio.rest.resources import Transport
 
 def create_mock_json(path):
     with open(path) as f:
         resp = Mock()
         resp.content = f.read()
         return resp
+
+
+def mock_response(status=200, content="{}", headers=None, timings=None,
+                  url="http://random/url.json"):
+    resp = Mock()
+    resp.status_code = status
+    resp.ok = status < 400
+    resp.content = content
+    resp.headers = headers or {}
+    resp.timings = timings
+    resp.url = url
+    return resp
+
+
+def mock_transport(*responses, **kwargs):
+    """
+    Return a Transport whose requests return or raise each of responses in
+    turn
+    """
+    transport = Transport(**kwargs)
+    transport.request = Mock(side_effect=list(responses))
+    return transport
+
+
+class TwilioHandler(BaseHTTPRequestHandler):
+    """
+    Answer requests with the fixture files in routes, or a 404
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    routes = {
+        ("POST", "/2010-04-01/Accounts/AC123/Calls.json"):
+            (201, "tests/resources/calls_instance.json"),
+        ("GET", "/2010-04-01/Accounts/AC123/SMS/Messages.json"):
+            (200, "tests/resources/sms_messages_list.json"),
+        }
+
+    def do_GET(self):
+        self.respond()
+
+    def do_POST(self):
+        length = int(self.headers.getheader("content-length", 0))
+        self.rfile.read(length)
+        self.respond()
+
+    def route(self):
+        """
+        Return the status and body of the response to this request
+        """
+        try:
+            status, path = self.routes[(self.command, self.path)]
+        except KeyError:
+            return 404, '{"code": 20404, "message": "Not Found"}'
+        return status, open(path).read()
+
+    def respond(self):
+        self.server.requests.append((self.command, self.path,
+                                     self.headers.getheader("authorization")))
+        self.server.clients.add(self.client_address)
+        status, body = self.route()
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TwilioServer(ThreadingMixIn, HTTPServer):
+    """
+    A local HTTP server run on a background thread, recording the method,
+    path and authorization of each request and the address of each client
+    """
+
+    daemon_threads = True
+
+    def __init__(self, handler=TwilioHandler):
+        HTTPServer.__init__(self, ("127.0.0.1", 0), handler)
+        self.requests = []
+        self.clients = set()
+        self.base = "http://127.0.0.1:%d" % self.server_address[1]
+
+    def start(self):
+        thread = threading.Thread(target=self.serve_forever)
+        thread.daemon = True
+        thread.start()
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
@@ -1,7 +1,17 @@
 import logging
 import os
+import types
 from twilio import TwilioException
 from twilio.rest.resources import make_request
+from twilio.rest.resources import Executor
+from twilio.rest.resources import FileCache
+from twilio.rest.resources import Hooks
+from twilio.rest.resources import LRUCache
+from twilio.rest.resources import RateLimiter
+from twilio.rest.resources import RequestStats
+from twilio.rest.resources import Resource
+from twilio.rest.resources import RetryPolicy
+from twilio.rest.resources import Transport
 from twilio.rest.resources import Accounts
 from twilio.rest.resources import Applications
 from twilio.rest.resources import Calls
@@ -14,8 +24,6 @@ from twilio.rest.resources import Participants
 from twilio.rest.resources import PhoneNumbers
 from twilio.rest.resources import Conferences
 from twilio.rest.resources import Sandboxes
-from urllib import urlencode
-from urlparse import urljoin
 
 
 def find_credentials():
@@ -33,8 +41,28 @@ def find_credentials():
 class TwilioRestClient(object):
     """
     A client for accessing the Twilio REST API
+
+    Callbacks added to :attr:`hooks`, a :class:`Hooks`, are called for every
+    request the client makes.
+
+    Resources are created the first time they are used.
     """
 
+    # Attribute name -> (resource class, attribute holding its base uri)
+    resources = {
+        "accounts": (Accounts, "version_uri"),
+        "applications": (Applications, "account_uri"),
+        "calls": (Calls, "account_uri"),
+        "caller_ids": (CallerIds, "account_uri"),
+        "notifications": (Notifications, "account_uri"),
+        "recordings": (Recordings, "account_uri"),
+        "transcriptions": (Transcriptions, "account_uri"),
+        "sms": (Sms, "account_uri"),
+        "phone_numbers": (PhoneNumbers, "account_uri"),
+        "conferences": (Conferences, "account_uri"),
+        "sandboxes": (Sandboxes, "account_uri"),
+        }
+
     def request(self, path, method=None, vars=None):
         """sends a request and gets a response from the Twilio REST API
 
@@ -76,15 +104,42 @@ class TwilioRestClient(object):
             "User-Agent": "twilio-python",
             }
 
-        resp = make_request(method, uri, auth=self.auth, data=data,
-                            params=params, headers=headers)
+        resp = self.transport.request(method, uri, data=data, params=params,
+                                      headers=headers)
 
         return resp.content
 
     def __init__(self, account=None, token=None, base="https://api.twilio.com",
-                 version="2010-04-01", client=None):
+                 version="2010-04-01", client=None, pool_size=10,
+                 idle_timeout=60, preemptive_auth=True, retry=None,
+                 timeout=None, deadline=None, rate_limiter=None, cache=None,
+                 body_log_limit=0):
         """
         Create a Twilio REST API client.
+
+        :param int pool_size: Maximum number of keep-alive connections shared
+                              by all resources of this client
+        :param idle_timeout: Seconds before an unused connection is closed
+                             and reopened. None keeps connections forever.
+        :param bool preemptive_auth: Send credentials with every request
+                                     instead of waiting for a 401 challenge
+        :param retry: A :class:`RetryPolicy` for failed requests. Defaults to
+                      retrying GET and DELETE requests up to three times.
+                      Pass RetryPolicy(attempts=1) to disable retries.
+        :param timeout: Seconds to wait for a connection and for each read
+                        from the socket. None waits forever.
+        :param deadline: Maximum number of seconds any single operation may
+                         take, including retries. None means no limit.
+        :param rate_limiter: A :class:`RateLimiter` shared by every request
+                             this client makes, from any thread
+        :param cache: A cache backend, such as :class:`LRUCache` or
+                      :class:`FileCache`, for applications, phone numbers,
+                      caller ids and short codes fetched with get(). None
+                      disables caching.
+        :param int body_log_limit: Number of bytes of each response body
+                                   logged to the twilio.rest logger at DEBUG
+                                   level. Defaults to 0, bodies are never
+                                   logged.
         """
 
         # Get account credentials
@@ -97,20 +152,31 @@ class TwilioRestClient(object):
         version_uri = "%s/%s" % (base, version)
         account_uri = "%s/%s/Accounts/%s" % (base, version, account)
 
-        self.accounts = Accounts(version_uri, auth)
-        self.applications = Applications(account_uri, auth)
-        self.calls = Calls(account_uri, auth)
-        self.caller_ids = CallerIds(account_uri, auth)
-        self.notifications = Notifications(account_uri, auth)
-        self.recordings = Recordings(account_uri, auth)
-        self.transcriptions = Transcriptions(account_uri, auth)
-        self.sms = Sms(account_uri, auth)
-        self.phone_numbers = PhoneNumbers(account_uri, auth)
-        self.conferences = Conferences(account_uri, auth)
-        self.sandboxes = Sandboxes(account_uri, auth)
+        if retry is None:
+            retry = RetryPolicy()
+
+        transport = Transport(auth, pool_size=pool_size,
+                              idle_timeout=idle_timeout,
+                              preemptive_auth=preemptive_auth, retry=retry,
+                              timeout=timeout, deadline=deadline,
+                              limiter=rate_limiter, cache=cache,
+                              body_log_limit=body_log_limit)
 
         self.auth = auth
+        self.version_uri = version_uri
         self.account_uri = account_uri
+        self.transport = transport
+        self.hooks = transport.hooks
+
+    def __getattr__(self, name):
+        try:
+            resource, base_uri = self.resources[name]
+        except KeyError:
+            raise AttributeError(name)
+
+        instance = resource(getattr(self, base_uri), self.auth, self.transport)
+        setattr(self, name, instance)
+        return instance
 
     def participants(self, conference_sid):
         """
@@ -118,5 +184,123 @@ class TwilioRestClient(object):
         with conference_sid,
         """
         base_uri = "%s/Conferences/%s" % (self.account_uri, conference_sid)
-        return Participants(base_uri, self.auth)
+        return Participants(base_uri, self.auth, self.transport)
+
+    def timeouts(self, timeout=None, deadline=None):
+        """
+        Return a context manager overriding the timeout and deadline of
+        requests made by the current thread. Iterators and batches created
+        inside the block, such as ``calls.iter(prefetch=2)``,
+        ``calls.export()`` or ``calls.create_many()``, keep the overrides on
+        their background threads.
+
+        .. code-block:: python
+
+            with client.timeouts(timeout=2, deadline=5):
+                call = client.calls.get("CA123")
+        """
+        return self.transport.timeouts(timeout, deadline)
+
+    def close(self):
+        """
+        Close all keep-alive connections held by this client
+        """
+        self.transport.close()
+
+
+class AsyncResource(object):
+    """
+    Wraps a resource so that each method call runs on an :class:`Executor`
+    and immediately returns a :class:`Future` for its result. Nested
+    resources, such as ``sms.messages``, are wrapped as well.
+
+    Methods returning iterators aren't available, since the iterator would
+    make its requests on the caller's thread. Calling one raises a
+    :class:`TwilioException`, and so does the future of any other call
+    returning a generator, such as ``list(stream=True)``.
+    """
+
+    iterators = frozenset([
+        "iter",
+        "iter_instances",
+        "iter_pages",
+        "iter_page_items",
+        "iter_page_streams",
+        "export",
+        "create_many",
+        "bulk_create",
+        ])
+
+    def __init__(self, resource, executor):
+        self.resource = resource
+        self.executor = executor
+
+    def __getattr__(self, name):
+        if name in self.iterators:
+            raise TwilioException("%s() returns an iterator and is not "
+                                  "available on the async client" % name)
 
+        attr = getattr(self.resource, name)
+
+        if isinstance(attr, (Resource, Sms)):
+            return AsyncResource(attr, self.executor)
+
+        if callable(attr):
+            def call(*args, **kwargs):
+                result = attr(*args, **kwargs)
+                if isinstance(result, types.GeneratorType):
+                    result.close()
+                    raise TwilioException("%s() returned an iterator, which "
+                                          "the async client can't return"
+                                          % name)
+                return result
+
+            def submit(*args, **kwargs):
+                return self.executor.submit(call, *args, **kwargs)
+            return submit
+
+        return attr
+
+
+class AsyncTwilioRestClient(object):
+    """
+    A client for the Twilio REST API that does not block the caller.
+
+    It has the same resources as :class:`TwilioRestClient`, but every
+    resource method returns a :class:`Future`. Calls run on a pool of worker
+    threads sharing the client's keep-alive connections.
+
+    :param int workers: Maximum number of requests in flight at once
+
+    Any other keyword arguments are passed to :class:`TwilioRestClient`.
+    """
+
+    def __init__(self, account=None, token=None, workers=10, **kwargs):
+        kwargs.setdefault("pool_size", workers)
+
+        self.client = TwilioRestClient(account, token, **kwargs)
+        self.executor = Executor(workers)
+        self.hooks = self.client.hooks
+
+    def __getattr__(self, name):
+        if name not in TwilioRestClient.resources:
+            raise AttributeError(name)
+
+        resource = AsyncResource(getattr(self.client, name), self.executor)
+        setattr(self, name, resource)
+        return resource
+
+    def participants(self, conference_sid):
+        """
+        Return an :class:`AsyncResource` wrapping the :class:`Participants`
+        of the :class:`Conference` with conference_sid
+        """
+        resource = self.client.participants(conference_sid)
+        return AsyncResource(resource, self.executor)
+
+    def close(self):
+        """
+        Stop the worker threads and close all keep-alive connections
+        """
+        self.executor.shutdown()
+        self.client.close()
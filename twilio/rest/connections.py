@@ -0,0 +1,65 @@
+"""
+HTTP connections recording how long each request spends connecting and
+waiting for its response, while the current thread's request timer runs.
+Imported on the first request, along with httplib2.
+"""
+import time
+
+from twilio.rest.resources import request_timer
+from twilio.rest.resources import timer_running
+
+# import httplib2
+try:
+    import httplib2
+except ImportError:
+    from twilio.contrib import httplib2
+
+
+class TimedHTTPConnection(httplib2.HTTPConnectionWithTimeout):
+    """
+    An HTTP connection recording its connect and first byte times in the
+    current thread's request timer
+    """
+
+    def connect(self):
+        if not timer_running():
+            return httplib2.HTTPConnectionWithTimeout.connect(self)
+
+        start = time.time()
+        httplib2.HTTPConnectionWithTimeout.connect(self)
+        request_timer.connect = time.time() - start
+
+    def getresponse(self, *args, **kwargs):
+        resp = httplib2.HTTPConnectionWithTimeout.getresponse(self, *args,
+                                                              **kwargs)
+        if timer_running():
+            request_timer.first_byte = time.time() - request_timer.start
+        return resp
+
+
+class TimedHTTPSConnection(httplib2.HTTPSConnectionWithTimeout):
+    """
+    An HTTPS connection recording its connect and first byte times in the
+    current thread's request timer
+    """
+
+    def connect(self):
+        if not timer_running():
+            return httplib2.HTTPSConnectionWithTimeout.connect(self)
+
+        start = time.time()
+        httplib2.HTTPSConnectionWithTimeout.connect(self)
+        request_timer.connect = time.time() - start
+
+    def getresponse(self, *args, **kwargs):
+        resp = httplib2.HTTPSConnectionWithTimeout.getresponse(self, *args,
+                                                               **kwargs)
+        if timer_running():
+            request_timer.first_byte = time.time() - request_timer.start
+        return resp
+
+
+TIMED = {
+    "http": TimedHTTPConnection,
+    "https": TimedHTTPSConnection,
+    }
@@ -1,14 +1,24 @@
 import base64
+import copy
 import datetime
+import importlib
 import json
 import logging
+import random
 import re
 import os
-import urllib
-
+import socket
+import sys
+import threading
+import time
+import Queue
+
+from collections import namedtuple
+from collections import OrderedDict
+from contextlib import contextmanager
 from twilio import TwilioException
 from twilio import TwilioRestException
-from urllib import urlencode
+from urlparse import urljoin
 from urlparse import urlparse
 
 # import json
@@ -20,11 +30,47 @@ except ImportError:
     except ImportError:
         from django.utils import simplejson as json
 
-# import httplib2
 try:
-    import httplib2
+    import fcntl
 except ImportError:
-    from twilio.contrib import httplib2
+    fcntl = None
+
+
+
+class LazyModule(object):
+    """
+    Stands in for a module until one of its attributes is first used, so
+    that importing twilio.rest stays cheap. If a module name can't be
+    imported, the next one is tried.
+    """
+
+    def __init__(self, *names):
+        self._names = names
+        self._module = None
+
+    def __getattr__(self, attr):
+        if self._module is None:
+            self._module = self._load()
+        return getattr(self._module, attr)
+
+    def _load(self):
+        for name in self._names[:-1]:
+            try:
+                return importlib.import_module(name)
+            except ImportError:
+                pass
+        return importlib.import_module(self._names[-1])
+
+
+# These pull in ssl, email and the socks stack, and aren't needed until the
+# first request is sent
+anydbm = LazyModule("anydbm")
+httplib = LazyModule("httplib")
+httplib2 = LazyModule("httplib2", "twilio.contrib.httplib2")
+urllib = LazyModule("urllib")
+connections = LazyModule("twilio.rest.connections")
+
+logger = logging.getLogger("twilio.rest")
 
 
 def transform_params(p):
@@ -49,6 +95,40 @@ def parse_date(d):
         return d
 
 
+def date_windows(start, end, days=1):
+    """
+    Split the inclusive date range start..end into consecutive windows of at
+    most days days. Return a list of (first, last) date tuples, most recent
+    window first.
+    """
+    if days < 1:
+        raise ValueError("days must be at least 1, not %r" % (days,))
+
+    start, end = to_date(start), to_date(end)
+    step = datetime.timedelta(days=days - 1)
+    windows = []
+
+    first = start
+    while first <= end:
+        last = min(first + step, end)
+        windows.append((first, last))
+        first = last + datetime.timedelta(days=1)
+
+    windows.reverse()
+    return windows
+
+
+def to_date(d):
+    """
+    Return d as a datetime.date. Strings must be formatted as YYYY-MM-DD
+    """
+    if isinstance(d, datetime.datetime):
+        return d.date()
+    elif isinstance(d, datetime.date):
+        return d
+    return datetime.datetime.strptime(d, "%Y-%m-%d").date()
+
+
 def convert_boolean(bool):
     if bool == True:
         return "true"
@@ -100,54 +180,1550 @@ def normalize_dates(myfunc):
     return inner_func
 
 
-class Response(object):
+def prefetch_iter(iterable, depth=1):
+    """
+    Yield the items of iterable while a background thread reads up to depth
+    items ahead. Exceptions raised by the iterable are re-raised in the
+    consuming thread.
+    """
+    items = Queue.Queue(maxsize=depth)
+    done = object()
+    stop = threading.Event()
+
+    def put(item):
+        while not stop.is_set():
+            try:
+                items.put(item, timeout=0.1)
+                return True
+            except Queue.Full:
+                pass
+        return False
+
+    def produce():
+        try:
+            for item in iterable:
+                if not put((item, None)):
+                    return
+        except Exception:
+            put((done, sys.exc_info()))
+        else:
+            put((done, None))
+
+    producer = threading.Thread(target=produce)
+    producer.daemon = True
+    producer.start()
+
+    try:
+        while True:
+            item, exc_info = items.get()
+            if item is done:
+                if exc_info is not None:
+                    raise exc_info[0], exc_info[1], exc_info[2]
+                return
+            yield item
+    finally:
+        stop.set()
+
+
+def chain_concurrently(sources, workers=4, ordered=True):
+    """
+    Yield the items of several iterables, reading up to workers of them at
+    the same time on background threads.
+
+    :param sources: A list of callables, each returning an iterable
+    :param bool ordered: If True, yield every item of the first source, then
+                         every item of the second, and so on. Later sources
+                         buffer a few items and then wait for their turn. If
+                         False, yield items as soon as any source produces
+                         them.
+    """
+    done = object()
+    stop = threading.Event()
+    tasks = Queue.Queue()
+    shared = Queue.Queue(maxsize=workers * 2)
+    outputs = []
+
+    # Sources are started in order, so the one being consumed always has a
+    # worker and bounded queues can't deadlock
+    for source in sources:
+        output = Queue.Queue(maxsize=workers * 2) if ordered else shared
+        outputs.append(output)
+        tasks.put((source, output))
+
+    def put(output, item):
+        while not stop.is_set():
+            try:
+                output.put(item, timeout=0.1)
+                return True
+            except Queue.Full:
+                pass
+        return False
+
+    def work():
+        while not stop.is_set():
+            try:
+                source, output = tasks.get_nowait()
+            except Queue.Empty:
+                return
+
+            try:
+                for item in source():
+                    if not put(output, (item, None)):
+                        return
+            except Exception:
+                put(output, (done, sys.exc_info()))
+            else:
+                put(output, (done, None))
+
+    for i in range(min(workers, len(outputs))):
+        worker = threading.Thread(target=work)
+        worker.daemon = True
+        worker.start()
+
+    def drain(output, remaining):
+        while remaining:
+            item, exc_info = output.get()
+            if item is done:
+                if exc_info is not None:
+                    raise exc_info[0], exc_info[1], exc_info[2]
+                remaining -= 1
+            else:
+                yield item
+
+    try:
+        if ordered:
+            for output in outputs:
+                for item in drain(output, 1):
+                    yield item
+        else:
+            for item in drain(shared, len(outputs)):
+                yield item
+    finally:
+        stop.set()
+
+
+class Future(object):
+    """
+    The eventual result of a call submitted to an :class:`Executor`
+    """
+
+    def __init__(self):
+        self._done = threading.Event()
+        self._lock = threading.Lock()
+        self._callbacks = []
+        self._result = None
+        self._exc_info = None
+
+    def done(self):
+        """
+        Return True if the call has finished
+        """
+        return self._done.is_set()
+
+    def result(self, timeout=None):
+        """
+        Wait for the call to finish and return its result, re-raising any
+        exception it raised
+
+        :param timeout: Seconds to wait before raising a TwilioException.
+                        None waits forever.
+        """
+        exc_info = self.exc_info(timeout)
+        if exc_info is not None:
+            raise exc_info[0], exc_info[1], exc_info[2]
+        return self._result
+
+    def exception(self, timeout=None):
+        """
+        Wait for the call to finish and return the exception it raised, or
+        None if it succeeded
+        """
+        exc_info = self.exc_info(timeout)
+        if exc_info is not None:
+            return exc_info[1]
+
+    def exc_info(self, timeout=None):
+        if not self._done.wait(timeout):
+            raise TwilioException("Timed out waiting for result")
+        return self._exc_info
+
+    def add_done_callback(self, fn):
+        """
+        Call fn with this future once the call finishes. If it has already
+        finished, fn is called immediately.
+        """
+        with self._lock:
+            if not self.done():
+                self._callbacks.append(fn)
+                return
+        fn(self)
+
+    def set_result(self, result):
+        self._result = result
+        self._finish()
+
+    def set_exc_info(self, exc_info):
+        self._exc_info = exc_info
+        self._finish()
+
+    def _finish(self):
+        with self._lock:
+            self._done.set()
+            callbacks, self._callbacks = self._callbacks, []
+
+        for fn in callbacks:
+            try:
+                fn(self)
+            except Exception:
+                logger.exception("Future callback %r raised", fn)
+
+
+class Executor(object):
+    """
+    Runs calls on a fixed-size pool of worker threads. Threads are started
+    as calls are submitted, up to workers threads.
+
+    :param int workers: Maximum number of calls running at the same time
+    """
+
+    def __init__(self, workers=10):
+        if workers < 1:
+            raise ValueError("Executor needs at least one worker")
+
+        self.workers = workers
+        self._tasks = Queue.Queue()
+        self._threads = []
+        self._lock = threading.Lock()
+
+    def submit(self, fn, *args, **kwargs):
+        """
+        Schedule fn(*args, **kwargs) and return a :class:`Future` for its
+        result
+        """
+        future = Future()
+        self._tasks.put((future, fn, args, kwargs))
+
+        with self._lock:
+            if len(self._threads) < self.workers:
+                worker = threading.Thread(target=self._work)
+                worker.daemon = True
+                worker.start()
+                self._threads.append(worker)
+
+        return future
+
+    def _work(self):
+        while True:
+            task = self._tasks.get()
+            if task is None:
+                return
+
+            future, fn, args, kwargs = task
+            try:
+                result = fn(*args, **kwargs)
+            except Exception:
+                future.set_exc_info(sys.exc_info())
+            else:
+                future.set_result(result)
+
+    def shutdown(self):
+        """
+        Stop every worker thread once the calls already submitted finish
+        """
+        with self._lock:
+            threads, self._threads = self._threads, []
+
+        for worker in threads:
+            self._tasks.put(None)
+
+
+def map_concurrently(fn, iterable, workers=10):
+    """
+    Call fn on every item of iterable using up to workers threads. Yield an
+    (item, :class:`Future`) pair for each call in the order the calls finish.
+
+    The iterable is consumed lazily, so at most workers items are in flight
+    at once no matter how long it is.
+    """
+    executor = Executor(workers)
+    finished = Queue.Queue()
+    pending = 0
+
+    def submit(item):
+        future = executor.submit(fn, item)
+        future.add_done_callback(lambda f: finished.put((item, f)))
+
+    try:
+        for item in iterable:
+            submit(item)
+            pending += 1
+            if pending >= workers:
+                yield finished.get()
+                pending -= 1
+
+        while pending:
+            yield finished.get()
+            pending -= 1
+    finally:
+        executor.shutdown()
+
+
+# The outcome of one request in a bulk operation. Exactly one of instance
+# and error is set.
+BulkResult = namedtuple("BulkResult", ["request", "instance", "error"])
+
+# Statuses meaning Twilio is throttling us and the request can be resent
+THROTTLED_STATUSES = (429, 503)
+
+
+class TokenBucket(object):
+    """
+    A thread-safe token bucket limiting callers to rate acquisitions per
+    second on average, with bursts of up to capacity.
+
+    :param float rate: Tokens added to the bucket per second
+    :param capacity: Maximum number of tokens in the bucket. Defaults to rate,
+                     allowing one second worth of burst.
+    """
+
+    def __init__(self, rate, capacity=None):
+        if rate <= 0:
+            raise ValueError("TokenBucket rate must be positive")
+
+        self.rate = float(rate)
+        self.capacity = float(capacity or max(rate, 1))
+        self.tokens = self.capacity
+        self.updated = time.time()
+        self._lock = threading.Lock()
+
+    def refill(self):
+        """
+        Add the tokens accumulated since the last refill. Must be called
+        with the lock held.
+        """
+        now = time.time()
+        elapsed = max(now - self.updated, 0)
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+        self.updated = now
+
+    def acquire(self, timeout=None):
+        """
+        Take a token from the bucket, sleeping until one is available. Return
+        False without taking a token if none will be available within
+        timeout seconds. None waits as long as needed.
+        """
+        if timeout is not None:
+            expires = time.time() + timeout
+
+        while True:
+            with self._lock:
+                self.refill()
+
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return True
+
+                wait = (1 - self.tokens) / self.rate
+
+            if timeout is not None and time.time() + wait > expires:
+                return False
+
+            time.sleep(wait)
+
+
+class AdaptiveTokenBucket(TokenBucket):
+    """
+    A :class:`TokenBucket` whose rate shrinks when Twilio throttles requests
+    and recovers gradually as requests succeed again.
+
+    :param float rate: The maximum rate, in tokens per second
+    :param min_rate: The rate never drops below this. Defaults to a
+                     twentieth of rate.
+    :param float decrease: The rate is multiplied by this after every
+                           throttled request
+    :param float recovery: Fraction of the maximum rate added back after
+                           every successful request
+    """
+
+    def __init__(self, rate, capacity=None, min_rate=None, decrease=0.5,
+                 recovery=0.05):
+        super(AdaptiveTokenBucket, self).__init__(rate, capacity)
+        self.max_rate = self.rate
+        self.min_rate = min_rate or self.rate / 20
+        self.decrease = decrease
+        self.recovery = recovery
+
+    def throttle(self):
+        """
+        Shrink the rate and drop any saved up burst
+        """
+        with self._lock:
+            self.refill()
+            self.rate = max(self.min_rate, self.rate * self.decrease)
+            self.tokens = min(self.tokens, 0)
+
+    def recover(self):
+        """
+        Grow the rate back towards its maximum
+        """
+        with self._lock:
+            self.refill()
+            self.rate = min(self.max_rate,
+                            self.rate + self.max_rate * self.recovery)
+
+
+class RateLimiter(object):
+    """
+    Limits the rate of requests made by a :class:`TwilioRestClient`, across
+    every thread and resource using it. Each budget adapts to Twilio: it
+    shrinks when a request is throttled with a 429 and recovers gradually.
+
+    :param rate: Requests per second for requests without a more specific
+                 budget. None leaves them unlimited.
+    :param dict limits: Separate budgets, in requests per second. Keys are a
+                        resource class name such as "Calls", an HTTP method
+                        such as "POST", or a (name, method) tuple. The most
+                        specific matching budget is used.
+
+    Other keyword arguments are passed to every
+    :class:`AdaptiveTokenBucket`.
+    """
+
+    def __init__(self, rate=None, limits=None, **kwargs):
+        self.default = None
+        self.buckets = {}
+
+        if rate is not None:
+            self.default = AdaptiveTokenBucket(rate, **kwargs)
+
+        for key, limit in (limits or {}).items():
+            self.buckets[key] = AdaptiveTokenBucket(limit, **kwargs)
+
+    def bucket(self, method, resource=None):
+        """
+        Return the budget for a request, or None if it is unlimited
+        """
+        name = resource.__name__ if resource is not None else None
+
+        for key in [(name, method), name, method]:
+            if key in self.buckets:
+                return self.buckets[key]
+
+        return self.default
+
+    def acquire(self, method, resource=None, timeout=None):
+        """
+        Wait until a request is allowed. Return False if it won't be allowed
+        within timeout seconds. None waits as long as needed.
+        """
+        bucket = self.bucket(method, resource)
+        if bucket is None:
+            return True
+        return bucket.acquire(timeout)
+
+    def throttled(self, method, resource=None):
+        """
+        Record that Twilio throttled a request
+        """
+        bucket = self.bucket(method, resource)
+        if bucket is not None:
+            bucket.throttle()
+
+    def succeeded(self, method, resource=None):
+        """
+        Record that a request succeeded
+        """
+        bucket = self.bucket(method, resource)
+        if bucket is not None:
+            bucket.recover()
+
+
+class CacheBackend(object):
+    """
+    Interface for the cache of instance resources used by a
+    :class:`Transport`. Keys are resource URIs and values are dicts of JSON
+    types.
+
+    :param ttl: Seconds a fetched instance is served from the cache before
+                it is requested from Twilio again
+    :param stale_ttl: Seconds a stale instance with an ETag or Last-Modified
+                      header is kept after its ttl, to be revalidated with a
+                      conditional request
+    """
+
+    ttl = 60
+    stale_ttl = 24 * 60 * 60
+
+    def get(self, key):
+        """
+        Return the value stored under key, or None if it is missing or has
+        expired
+        """
+        raise NotImplementedError
+
+    def set(self, key, value, ttl=None):
+        """
+        Store value under key, dropping it after ttl seconds. None keeps the
+        value until it is evicted.
+        """
+        raise NotImplementedError
+
+    def delete(self, key):
+        """
+        Remove the value stored under key
+        """
+        raise NotImplementedError
+
+
+class LRUCache(CacheBackend):
+    """
+    An in-process cache of up to max_size entries, evicting the least
+    recently used entry first. Safe to share between threads.
+
+    :param int max_size: Maximum number of entries kept
+    :param ttl: Seconds a fetched instance is served from the cache before
+                it is requested from Twilio again
+    :param stale_ttl: Seconds a stale instance that can be revalidated is
+                      kept after its ttl
+    """
+
+    def __init__(self, max_size=1000, ttl=60, stale_ttl=24 * 60 * 60):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.pop(key, None)
+            if entry is None:
+                return None
+
+            value, expires = entry
+            if expires is not None and expires <= time.time():
+                return None
+
+            self.entries[key] = entry
+            return value
+
+    def set(self, key, value, ttl=None):
+        expires = None if ttl is None else time.time() + ttl
+
+        with self.lock:
+            self.entries.pop(key, None)
+            self.entries[key] = (value, expires)
+
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+
+    def delete(self, key):
+        with self.lock:
+            self.entries.pop(key, None)
+
+    def clear(self):
+        """
+        Remove every entry
+        """
+        with self.lock:
+            self.entries.clear()
+
+
+class FileCache(CacheBackend):
+    """
+    A cache stored in a dbm file, shared by every process on the host that
+    opens the same path. Access is serialized with a lock file, so the
+    cache is safe to use from several processes and threads.
+
+    The file has no size limit. Call :meth:`prune` now and then to remove
+    expired entries; every entry the client stores expires after at most
+    ttl + stale_ttl seconds.
+
+    :param path: Path of the dbm file, without extension
+    :param ttl: Seconds a fetched instance is served from the cache before
+                it is requested from Twilio again
+    :param stale_ttl: Seconds a stale instance that can be revalidated is
+                      kept after its ttl
+    """
+
+    def __init__(self, path, ttl=60, stale_ttl=24 * 60 * 60):
+        self.path = path
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.lock = threading.Lock()
+
+        with self.open("c"):
+            pass
+
+    @contextmanager
+    def open(self, flag="r"):
+        """
+        Open the dbm file while holding the lock file. Some dbm modules
+        write to disk even when reading, so readers lock exclusively too.
+        """
+        with self.lock:
+            lock_file = open(self.path + ".lock", "a")
+            try:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX)
+
+                db = anydbm.open(self.path, flag)
+                try:
+                    yield db
+                finally:
+                    db.close()
+            finally:
+                lock_file.close()
+
+    def get(self, key):
+        with self.open() as db:
+            try:
+                raw = db[str(key)]
+            except KeyError:
+                return None
+
+        expires, value = json.loads(raw)
+        if expires is not None and expires <= time.time():
+            return None
+
+        return value
+
+    def set(self, key, value, ttl=None):
+        expires = None if ttl is None else time.time() + ttl
+        raw = json.dumps([expires, value])
+
+        with self.open("w") as db:
+            db[str(key)] = raw
+
+    def delete(self, key):
+        with self.open("w") as db:
+            try:
+                del db[str(key)]
+            except KeyError:
+                pass
+
+    def prune(self):
+        """
+        Remove every expired entry from the file
+        """
+        now = time.time()
+
+        with self.open("w") as db:
+            for key in db.keys():
+                expires, value = json.loads(db[key])
+                if expires is not None and expires <= now:
+                    del db[key]
+
+
+class Response(object):
+    """
+    Take a httplib2 response and turn it into a requests response
+    """
+
+    def __init__(self, httplib_resp, content, url):
+        self.content = content
+        self.cached = False
+        self.status_code = int(httplib_resp.status)
+        self.ok = self.status_code < 400
+        self.url = url
+        self.headers = httplib_resp
+        self.timings = None
+
+
+class StreamResponse(object):
+    """
+    A response whose body is left on the socket, to be read in chunks with
+    read(). The connection is closed by close() or once content is read.
+    """
+
+    def __init__(self, conn, httplib_resp, url):
+        self.conn = conn
+        self.status_code = int(httplib_resp.status)
+        self.ok = self.status_code < 400
+        self.url = url
+        self.headers = dict(httplib_resp.getheaders())
+        self.timings = None
+        self.read = httplib_resp.read
+        self._content = None
+
+    @property
+    def content(self):
+        """
+        The rest of the body. Reading it closes the connection.
+        """
+        if self._content is None:
+            self._content = self.read()
+            self.close()
+        return self._content
+
+    def close(self):
+        self.conn.close()
+
+
+class JsonStream(object):
+    """
+    Parse a JSON document incrementally from a read(size) function,
+    keeping only the unparsed part of the last chunk in memory
+    """
+
+    whitespace = " \t\r\n"
+    number_chars = ".eE+-"
+
+    def __init__(self, read, chunk_size=8192):
+        self.read = read
+        self.chunk_size = chunk_size
+        self.decoder = json.JSONDecoder()
+        self.buffer = ""
+        self.pos = 0
+
+    def fill(self):
+        chunk = self.read(self.chunk_size)
+        if not chunk:
+            raise TwilioException("Unexpected end of JSON response")
+
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+
+    def peek(self):
+        """
+        Skip whitespace and return the next character without consuming it
+        """
+        while True:
+            while (self.pos < len(self.buffer)
+                   and self.buffer[self.pos] in self.whitespace):
+                self.pos += 1
+
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+
+            self.fill()
+
+    def expect(self, chars):
+        """
+        Consume the next character, which must be one of chars
+        """
+        char = self.peek()
+        if char not in chars:
+            raise TwilioException("Malformed JSON response, expected %s "
+                                  "but found %s" % (chars, char))
+        self.pos += 1
+        return char
+
+    def value(self):
+        """
+        Parse and consume the next complete JSON value
+        """
+        self.peek()
+
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except ValueError:
+                self.fill()
+                continue
+
+            # A number at the end of the buffer may continue in the next
+            # chunk, and one followed by the start of a fraction or exponent
+            # was cut short by it
+            if end < len(self.buffer) and not (
+                    isinstance(value, (int, long, float)) and
+                    self.buffer[end] in self.number_chars):
+                self.pos = end
+                return value
+
+            self.fill()
+
+    def iter_items(self, key, fields):
+        """
+        Yield the items of the key array of a JSON object one at a time.
+        Every other field of the object is stored in fields.
+        """
+        found = False
+        self.expect("{")
+
+        if self.peek() == "}":
+            self.pos += 1
+        else:
+            while True:
+                name = self.value()
+                self.expect(":")
+
+                if name == key and self.peek() == "[":
+                    found = True
+                    self.pos += 1
+
+                    if self.peek() == "]":
+                        self.pos += 1
+                    else:
+                        while True:
+                            yield self.value()
+                            if self.expect(",]") == "]":
+                                break
+                else:
+                    fields[name] = self.value()
+
+                if self.expect(",}") == "}":
+                    break
+
+        if not found:
+            raise TwilioException("Key %s not present in response" % key)
+
+
+def make_request(method, url,
+    params=None, data=None, headers=None, cookies=None, files=None,
+    auth=None, timeout=None, allow_redirects=False, proxies=None):
+    """Sends an HTTP request Returns :class:`Response <models.Response>`
+
+    See the requests documentation for explanation of all these parameters
+
+    timeout is the number of seconds to wait for the connection and for each
+    read from the socket. Currently allow_redirects, proxies, files, and
+    cookies are all ignored
+    """
+    http = httplib2.Http(timeout=timeout)
+
+    if auth is not None:
+        http.add_credentials(auth[0], auth[1])
+
+    if data is not None:
+        data = urllib.urlencode(data)
+
+    if params is not None:
+        enc_params = urllib.urlencode(params, doseq=True)
+        if urlparse(url).query:
+            url = '%s&%s' % (url, enc_params)
+        else:
+            url = '%s?%s' % (url, enc_params)
+
+    resp, content = http.request(url, method, headers=headers, body=data)
+
+    # Format httplib2 reqeusts as reqeusts objects
+    return Response(resp, content, url)
+
+
+def basic_auth_header(auth):
+    """
+    Return the value of an HTTP Basic Authorization header for a
+    (username, password) tuple
+    """
+    return "Basic %s" % base64.b64encode("%s:%s" % auth)
+
+
+def set_timeout(http, timeout):
+    """
+    Set the socket timeout of an :class:`httplib2.Http` and of every
+    connection it already has open
+    """
+    http.timeout = timeout
+    for conn in http.connections.values():
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+
+
+def close_connections(http):
+    """
+    Close every keep-alive connection cached by an :class:`httplib2.Http`
+    """
+    for conn in http.connections.values():
+        conn.close()
+    http.connections.clear()
+
+
+# How long a request spent opening a connection, including the DNS lookup
+# and TLS handshake (0 when a keep-alive connection was reused), waiting for
+# the first byte of the response and in total, in seconds
+Timings = namedtuple("Timings", ["connect", "first_byte", "total"])
+
+# Timings of the request in progress on the current thread
+request_timer = threading.local()
+
+
+def start_timer():
+    request_timer.start = time.time()
+    request_timer.connect = 0.0
+    request_timer.first_byte = None
+
+
+def stop_timer():
+    timings = Timings(request_timer.connect, request_timer.first_byte,
+                      time.time() - request_timer.start)
+    request_timer.start = None
+    return timings
+
+
+def timer_running():
+    """
+    Return True if the current thread is timing a request
+    """
+    return getattr(request_timer, "start", None) is not None
+
+
+class HttpPool(object):
+    """
+    A thread-safe pool of keep-alive :class:`httplib2.Http` objects.
+
+    Each :class:`httplib2.Http` keeps one open connection per host, so handing
+    the same objects out again lets requests skip the TCP and TLS handshake.
+
+    :param int size: Maximum number of :class:`httplib2.Http` objects in use
+                     at the same time. Further callers block until one is
+                     released.
+    :param idle_timeout: Seconds a connection may sit unused before it is
+                         closed and reopened. None keeps connections forever.
+    :param auth: Optional (username, password) tuple added to every
+                 :class:`httplib2.Http` in the pool
+    """
+
+    def __init__(self, size=10, idle_timeout=60, auth=None):
+        if size < 1:
+            raise ValueError("HttpPool size must be at least 1")
+
+        self.size = size
+        self.idle_timeout = idle_timeout
+        self.auth = auth
+        self.created = 0
+        self._idle = Queue.LifoQueue()
+        self._lock = threading.Lock()
+
+    def new_http(self):
+        http = httplib2.Http()
+        if self.auth is not None:
+            http.add_credentials(self.auth[0], self.auth[1])
+        return http
+
+    def acquire(self, timeout=None):
+        """
+        Return an :class:`httplib2.Http` from the pool, creating a new one if
+        the pool is not full yet. Raise a :class:`TwilioException` if none is
+        released within timeout seconds. None waits as long as needed.
+        """
+        try:
+            http, last_used = self._idle.get_nowait()
+        except Queue.Empty:
+            with self._lock:
+                create = self.created < self.size
+                if create:
+                    self.created += 1
+            if create:
+                return self.new_http()
+            try:
+                http, last_used = self._idle.get(timeout=timeout)
+            except Queue.Empty:
+                raise TwilioException("No connection was released within "
+                                      "%.3g seconds" % timeout)
+
+        idle = time.time() - last_used
+        if self.idle_timeout is not None and idle > self.idle_timeout:
+            close_connections(http)
+
+        return http
+
+    def release(self, http):
+        """
+        Return an :class:`httplib2.Http` to the pool
+        """
+        self._idle.put((http, time.time()))
+
+    def discard(self, http):
+        """
+        Close an :class:`httplib2.Http` whose connections are in an unknown
+        state and return it to the pool
+        """
+        close_connections(http)
+        self.release(http)
+
+    def close(self):
+        """
+        Close every idle connection in the pool
+        """
+        while True:
+            try:
+                http, last_used = self._idle.get_nowait()
+            except Queue.Empty:
+                break
+            close_connections(http)
+            with self._lock:
+                self.created -= 1
+
+
+class Transport(object):
+    """
+    Sends requests for a :class:`TwilioRestClient` over pooled keep-alive
+    connections. A single transport is shared by every resource of a client
+    and is safe to use from multiple threads.
+
+    :param auth: (account_sid, token) tuple used for every request
+    :param int pool_size: Maximum number of concurrent connections per host
+    :param idle_timeout: Seconds before an unused connection is reopened
+    :param bool preemptive_auth: Send the Authorization header with the first
+                                 request instead of waiting for a 401
+                                 challenge, saving a round trip per request
+    :param retry: The :class:`RetryPolicy` for failed requests. None never
+                  retries.
+    :param timeout: Seconds to wait for a connection and for each read from
+                    the socket. None waits forever.
+    :param deadline: Maximum number of seconds a request may take, including
+                     every retry and waiting for the rate limiter or a free
+                     connection. None means no limit.
+    :param limiter: A :class:`RateLimiter` every request waits on. None
+                    sends requests immediately.
+    :param cache: A :class:`CacheBackend` for instances of cacheable
+                  resources. None always fetches instances from Twilio.
+    :param int body_log_limit: Number of bytes of each response body logged
+                               to the twilio.rest logger at DEBUG level. 0
+                               never logs bodies.
+    :param hooks: The :class:`Hooks` called for every request. Defaults to
+                  an empty set of hooks.
+    """
+
+    def __init__(self, auth=None, pool_size=10, idle_timeout=60,
+                 preemptive_auth=True, retry=None, timeout=None,
+                 deadline=None, limiter=None, cache=None, body_log_limit=0,
+                 hooks=None):
+        self.auth = auth
+        self.body_log_limit = body_log_limit
+        self.hooks = hooks if hooks is not None else Hooks()
+        self.auth_header = None
+        self.retry = retry
+        self.limiter = limiter
+        self.cache = cache
+        self.timeout = timeout
+        self.deadline = deadline
+        self.local = threading.local()
+
+        if auth is not None and preemptive_auth:
+            self.auth_header = basic_auth_header(auth)
+            self.pool = HttpPool(pool_size, idle_timeout)
+        else:
+            self.pool = HttpPool(pool_size, idle_timeout, auth=auth)
+
+    def get_timeout(self):
+        """
+        Return the socket timeout for requests made by the current thread
+        """
+        return getattr(self.local, "timeout", self.timeout)
+
+    def get_deadline(self):
+        """
+        Return the deadline for requests made by the current thread
+        """
+        return getattr(self.local, "deadline", self.deadline)
+
+    def get_retry(self):
+        """
+        Return the retry policy for requests made by the current thread
+        """
+        return getattr(self.local, "retry", self.retry)
+
+    @contextmanager
+    def retrying(self, retry):
+        """
+        Use the :class:`RetryPolicy` retry for requests made by the current
+        thread inside a with block
+        """
+        previous = self.get_retry()
+        self.local.retry = retry
+
+        try:
+            yield
+        finally:
+            self.local.retry = previous
+
+    @contextmanager
+    def timeouts(self, timeout=None, deadline=None):
+        """
+        Override the timeout and deadline of requests made by the current
+        thread inside a with block. None keeps the current value.
+        """
+        previous = self.get_timeout(), self.get_deadline()
+
+        if timeout is not None:
+            self.local.timeout = timeout
+        if deadline is not None:
+            self.local.deadline = deadline
+
+        try:
+            yield
+        finally:
+            self.local.timeout, self.local.deadline = previous
+
+    def settings(self):
+        """
+        Return the timeout, deadline and retry policy of requests made by the
+        current thread, so they can be applied on another with :meth:`using`
+        """
+        return self.get_timeout(), self.get_deadline(), self.get_retry()
+
+    @contextmanager
+    def using(self, settings):
+        """
+        Apply settings returned by :meth:`settings` to requests made by the
+        current thread inside a with block
+        """
+        previous = self.settings()
+        self.local.timeout, self.local.deadline, self.local.retry = settings
+
+        try:
+            yield
+        finally:
+            self.local.timeout, self.local.deadline, self.local.retry = previous
+
+    def bind(self, fn, settings=None):
+        """
+        Wrap fn so it runs with the settings of the calling thread, or
+        settings if given, on whichever thread eventually calls it
+        """
+        if settings is None:
+            settings = self.settings()
+
+        def bound(*args, **kwargs):
+            with self.using(settings):
+                return fn(*args, **kwargs)
+
+        return bound
+
+    def bind_iter(self, iterable, settings=None):
+        """
+        Like :meth:`bind`, for an iterable consumed on another thread. The
+        settings only apply while an item is being produced, never between
+        items.
+        """
+        if settings is None:
+            settings = self.settings()
+
+        def run(it):
+            try:
+                while True:
+                    with self.using(settings):
+                        try:
+                            item = next(it)
+                        except StopIteration:
+                            return
+                    yield item
+            finally:
+                close = getattr(it, "close", None)
+                if close is not None:
+                    close()
+
+        return run(iter(iterable))
+
+    def request(self, method, url, params=None, data=None, headers=None,
+                auth=None, timeout=None, pool_timeout=None, **kwargs):
+        """Sends an HTTP request Returns :class:`Response <models.Response>`
+
+        Accepts the same arguments as :func:`make_request`. The transport's
+        own credentials are always used, so auth is ignored. timeout defaults
+        to the transport's timeout. pool_timeout is the number of seconds to
+        wait for a connection when all of them are in use. None waits as
+        long as needed.
+        """
+        if timeout is None:
+            timeout = self.get_timeout()
+
+        if data is not None:
+            data = urllib.urlencode(data)
+
+        if params is not None:
+            enc_params = urllib.urlencode(params, doseq=True)
+            if urlparse(url).query:
+                url = '%s&%s' % (url, enc_params)
+            else:
+                url = '%s?%s' % (url, enc_params)
+
+        if self.auth_header is not None:
+            headers = dict(headers or {})
+            headers["Authorization"] = self.auth_header
+
+        http = self.pool.acquire(pool_timeout)
+
+        # New connections are always timed ones, so that connections kept
+        # alive from before a hook was added report timings too. They only
+        # read the clock while a timer runs, which needs a hook.
+        connection_type = connections.TIMED.get(urlparse(url).scheme)
+        timed = bool(self.hooks)
+        if timed:
+            start_timer()
+
+        try:
+            set_timeout(http, timeout)
+            resp, content = http.request(url, method, headers=headers,
+                                         body=data,
+                                         connection_type=connection_type)
+        except Exception:
+            self.pool.discard(http)
+            if timed:
+                stop_timer()
+            raise
+
+        self.pool.release(http)
+
+        resp = Response(resp, content, url)
+        if timed:
+            resp.timings = stop_timer()
+        return resp
+
+    def stream(self, method, url, params=None, data=None, headers=None,
+               auth=None, timeout=None, **kwargs):
+        """
+        Send an HTTP request and return a :class:`StreamResponse` as soon as
+        the headers arrive, leaving the body to be read in chunks. Streamed
+        requests get their own connection, closed along with the response.
+
+        Accepts the same arguments as :meth:`request`.
+        """
+        if timeout is None:
+            timeout = self.get_timeout()
+
+        if data is not None:
+            data = urllib.urlencode(data)
+
+        if params is not None:
+            enc_params = urllib.urlencode(params, doseq=True)
+            if urlparse(url).query:
+                url = '%s&%s' % (url, enc_params)
+            else:
+                url = '%s?%s' % (url, enc_params)
+
+        headers = dict(headers or {})
+        if self.auth is not None:
+            headers["Authorization"] = (self.auth_header or
+                                        basic_auth_header(self.auth))
+
+        parts = urlparse(url)
+        path = parts.path
+        if parts.query:
+            path = "%s?%s" % (path, parts.query)
+
+        if parts.scheme == "https":
+            connection_type = connections.TimedHTTPSConnection
+        else:
+            connection_type = connections.TimedHTTPConnection
+
+        conn = connection_type(parts.netloc, timeout=timeout)
+        timed = bool(self.hooks)
+        if timed:
+            start_timer()
+
+        try:
+            conn.request(method, path, data, headers)
+            resp = conn.getresponse()
+        except Exception:
+            conn.close()
+            if timed:
+                stop_timer()
+            raise
+
+        resp = StreamResponse(conn, resp, url)
+        if timed:
+            resp.timings = stop_timer()
+        return resp
+
+    def close(self):
+        """
+        Close all idle connections
+        """
+        self.pool.close()
+
+
+class RetryPolicy(object):
+    """
+    Decides which failed requests to Twilio are retried, and how long to wait
+    between attempts. Requests are retried after socket errors and after
+    responses with a retryable status.
+
+    :param int attempts: Maximum number of attempts, including the first one
+    :param float backoff: Seconds to wait before the first retry, doubling
+                          after each one
+    :param float max_backoff: Maximum number of seconds to wait between
+                              attempts
+    :param bool jitter: Wait a random time between zero and the backoff
+                        instead of the full backoff, so that many clients
+                        don't retry in lockstep
+    :param statuses: HTTP statuses that are retried
+    :param methods: HTTP methods that are retried. POST is not idempotent,
+                    so add it only if sending a request twice is harmless.
+    :param bool connection_errors: Retry requests that failed with a socket
+                                   error, including DNS and TLS handshake
+                                   failures. Such a request may still have
+                                   reached Twilio.
+
+    Add an on_retry callback to the client's :class:`Hooks` to be told about
+    every retry.
+    """
+
+    def __init__(self, attempts=3, backoff=0.5, max_backoff=30, jitter=True,
+                 statuses=(429, 500, 502, 503, 504),
+                 methods=("GET", "DELETE"), connection_errors=True):
+        self.attempts = attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.statuses = statuses
+        self.methods = methods
+        self.connection_errors = connection_errors
+        self.retries = 0
+        self._lock = threading.Lock()
+
+    def should_retry(self, method, attempt, error):
+        """
+        Return True if a request that failed with error on the given attempt,
+        counting from zero, should be sent again
+        """
+        if attempt + 1 >= self.attempts or method not in self.methods:
+            return False
+
+        if isinstance(error, TwilioRestException):
+            return error.status in self.statuses
+
+        return self.connection_errors
+
+    def delay(self, attempt):
+        """
+        Return the number of seconds to wait after the given attempt
+        """
+        delay = min(self.max_backoff, self.backoff * 2 ** attempt)
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return delay
+
+    def retry(self, delay):
+        """
+        Record a retry and wait delay seconds before it is sent
+        """
+        with self._lock:
+            self.retries += 1
+
+        time.sleep(delay)
+
+
+# What happened during one attempt of a request, passed to every hook.
+# status, bytes and timings are None until a response has been received,
+# and error is only set for on_retry and on_error.
+RequestEvent = namedtuple("RequestEvent", ["method", "resource", "uri",
+                                           "attempt", "status", "bytes",
+                                           "timings", "error"])
+
+
+class Hooks(object):
     """
-    Take a httplib2 response and turn it into a requests response
+    Callbacks run at each stage of the requests made by a client. Every
+    callback is called with a :class:`RequestEvent`.
+
+    before_request
+        Before each attempt is sent
+    after_response
+        After each attempt receives a response, whatever its status
+    on_retry
+        When a failed attempt is about to be retried
+    on_error
+        When a request fails for good and raises an exception
+
+    Exceptions raised by callbacks are logged and ignored.
     """
 
-    def __init__(self, httplib_resp, content, url):
-        self.content = content
-        self.cached = False
-        self.status_code = int(httplib_resp.status)
-        self.ok = self.status_code < 400
-        self.url = url
+    events = ("before_request", "after_response", "on_retry", "on_error")
 
+    def __init__(self):
+        self.callbacks = dict((event, []) for event in self.events)
 
-def make_request(method, url,
-    params=None, data=None, headers=None, cookies=None, files=None,
-    auth=None, timeout=None, allow_redirects=False, proxies=None):
-    """Sends an HTTP request Returns :class:`Response <models.Response>`
+    def __nonzero__(self):
+        return any(self.callbacks.values())
 
-    See the requests documentation for explanation of all these parameters
+    def add(self, event, fn):
+        """
+        Call fn on every occurrence of event
+        """
+        if event not in self.callbacks:
+            raise ValueError("Unknown hook event %s" % event)
+        self.callbacks[event].append(fn)
+        return fn
 
-    Currently timeout, allow_redirects, proxies, files, and cookies
-    are all ignored
+    def remove(self, event, fn):
+        """
+        Stop calling fn on event
+        """
+        self.callbacks[event].remove(fn)
+
+    def fire(self, event, request_event):
+        for fn in self.callbacks[event]:
+            try:
+                fn(request_event)
+            except Exception:
+                logger.exception("%s hook %r raised", event, fn)
+
+
+class RequestStats(object):
     """
-    http = httplib2.Http()
+    Aggregates request events in memory into per-resource latency
+    histograms and error rates, for exporting to a metrics system.
 
-    if auth is not None:
-        http.add_credentials(auth[0], auth[1])
+    .. code-block:: python
 
-    if data is not None:
-        data = urlencode(data)
+        stats = RequestStats()
+        stats.attach(client.hooks)
+        ...
+        report(stats.snapshot())
 
-    if params is not None:
-        enc_params = urlencode(params, doseq=True)
-        if urlparse(url).query:
-            url = '%s&%s' % (url, enc_params)
-        else:
-            url = '%s?%s' % (url, enc_params)
+    :param buckets: Upper bounds of the latency histogram buckets, in seconds
+    """
 
-    resp, content = http.request(url, method, headers=headers, body=data)
+    buckets = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
 
-    # Format httplib2 reqeusts as reqeusts objects
-    return Response(resp, content, url)
+    def __init__(self, buckets=None):
+        if buckets is not None:
+            self.buckets = tuple(sorted(buckets))
+        self.lock = threading.Lock()
+        self.reset()
+
+    def attach(self, hooks):
+        """
+        Start recording the requests made with hooks
+        """
+        hooks.add("after_response", self.record)
+        hooks.add("on_retry", self.record_failure)
+        hooks.add("on_error", self.record_failure)
+
+    def reset(self):
+        """
+        Forget everything recorded so far
+        """
+        with self.lock:
+            self.resources = {}
+
+    def stats(self, event):
+        name = event.resource.__name__ if event.resource else None
+
+        try:
+            return self.resources[name]
+        except KeyError:
+            stats = self.resources[name] = {
+                "requests": 0,
+                "errors": 0,
+                "latency_sum": 0.0,
+                "latency_counts": [0] * (len(self.buckets) + 1),
+                }
+            return stats
+
+    def record(self, event):
+        """
+        Record an attempt that received a response. Statuses of 400 and
+        above count as errors.
+        """
+        latency = event.timings.total if event.timings else 0.0
+
+        index = len(self.buckets)
+        for i, bound in enumerate(self.buckets):
+            if latency <= bound:
+                index = i
+                break
+
+        with self.lock:
+            stats = self.stats(event)
+            stats["requests"] += 1
+            stats["latency_sum"] += latency
+            stats["latency_counts"][index] += 1
+            if event.status >= 400:
+                stats["errors"] += 1
+
+    def record_failure(self, event):
+        """
+        Record an attempt that failed without a response. Failed responses
+        were already counted by record().
+        """
+        if event.status is not None:
+            return
+
+        with self.lock:
+            stats = self.stats(event)
+            stats["requests"] += 1
+            stats["errors"] += 1
+
+    def snapshot(self):
+        """
+        Return a dict of statistics keyed by resource class name. The
+        histogram maps each bucket's upper bound, and finally None for
+        slower requests, to the number of responses in that bucket.
+        """
+        bounds = list(self.buckets) + [None]
+        snapshot = {}
+
+        with self.lock:
+            for name, stats in self.resources.items():
+                requests = stats["requests"]
+                snapshot[name] = {
+                    "requests": requests,
+                    "errors": stats["errors"],
+                    "error_rate": float(stats["errors"]) / requests,
+                    "latency_sum": stats["latency_sum"],
+                    "latency_histogram": zip(bounds, stats["latency_counts"]),
+                    }
+
+        return snapshot
+
+
+def response_size(resp):
+    """
+    Return the length of a response body, without reading a streamed one
+    """
+    if isinstance(resp, StreamResponse):
+        return int(resp.headers.get("content-length", -1))
+    return len(resp.content)
 
 
-def make_twilio_request(method, uri, **kwargs):
+def log_response(method, resp, latency, resource=None, body_limit=0):
+    """
+    Log a response to the twilio.rest logger at DEBUG level. The first
+    body_limit bytes of the body are logged too, unless it is streamed.
+    """
+    size = response_size(resp)
+    body = None if isinstance(resp, StreamResponse) else resp.content
+
+    name = resource.__name__ if resource is not None else None
+    logger.debug("%s %s %d %.1fms %d bytes", method, resp.url,
+                 resp.status_code, latency * 1000, size, extra={
+                     "method": method,
+                     "uri": resp.url,
+                     "status": resp.status_code,
+                     "latency": latency,
+                     "bytes": size,
+                     "resource": name,
+                     })
+
+    if body_limit and body:
+        if len(body) > body_limit:
+            body = "%s... (%d bytes truncated)" % (body[:body_limit],
+                                                   len(body) - body_limit)
+        logger.debug("Response body: %s", body)
+
+
+def make_twilio_request(method, uri, transport=None, resource=None, **kwargs):
     """
     Make a request to Twilio. Throws an error
+
+    :param transport: A :class:`Transport` to send the request with. Defaults
+                      to a new connection for every request. Requests are
+                      retried according to the transport's retry policy.
+    :param timeout: Seconds to wait for the connection and each socket read.
+                    Defaults to the transport's timeout.
+    :param deadline: Maximum number of seconds for the whole request,
+                     including retries and waiting for the rate limiter or a
+                     free connection. Defaults to the transport's deadline.
+    :param resource: The :class:`Resource` class making the request, used to
+                     pick its rate limit
+    :param bool stream: Return a :class:`StreamResponse` whose body has not
+                        been read yet
     """
+    timeout = kwargs.pop("timeout", None)
+    deadline = kwargs.pop("deadline", None)
+    stream = kwargs.pop("stream", False)
+
+    if stream and transport is None:
+        transport = Transport(kwargs.get("auth"))
+
     headers = kwargs.get("headers", {})
     headers["User-Agent"] = "twilio-python"   # Add user aggent string
 
@@ -160,18 +1736,130 @@ def make_twilio_request(method, uri, **kwargs):
         headers["Accept"] = "application/json"
         uri = uri + ".json"
 
-    resp = make_request(method, uri, **kwargs)
-
-    if not resp.ok:
-        try:
-            error = json.loads(resp.content)
-            message = "%s: %s" % (error["code"], error["message"])
-        except:
-            message = resp.content
+    body_limit = 0
+    hooks = None
 
-        raise TwilioRestException(resp.status_code, resp.url, message)
+    if transport is None:
+        send, policy, limiter = make_request, None, None
+    else:
+        send, policy, limiter = transport.request, transport.get_retry(), \
+            transport.limiter
+        body_limit = transport.body_log_limit
+        if transport.hooks:
+            hooks = transport.hooks
+        if stream:
+            send = transport.stream
+        if timeout is None:
+            timeout = transport.get_timeout()
+        if deadline is None:
+            deadline = transport.get_deadline()
+
+    if deadline is not None:
+        expires = time.time() + deadline
+
+    debug = logger.isEnabledFor(logging.DEBUG)
+    attempt = 0
+
+    while True:
+        if limiter is not None:
+            wait = None
+            if deadline is not None:
+                wait = max(expires - time.time(), 0)
+            if not limiter.acquire(method, resource, wait):
+                error = TwilioException("%s %s would wait on the rate "
+                                        "limiter past its deadline" %
+                                        (method, uri))
+                if debug:
+                    logger.debug("%s %s failed: %r", method, uri, error)
+                if hooks:
+                    event = RequestEvent(method, resource, uri, attempt, None,
+                                         None, None, error)
+                    hooks.fire("on_error", event)
+                raise error
+
+        if deadline is not None:
+            remaining = max(expires - time.time(), 0.001)
+            kwargs["timeout"] = min(timeout or remaining, remaining)
+            if transport is not None:
+                kwargs["pool_timeout"] = remaining
+        elif timeout is not None:
+            kwargs["timeout"] = timeout
+
+        if hooks:
+            event = RequestEvent(method, resource, uri, attempt, None, None,
+                                 None, None)
+            hooks.fire("before_request", event)
+
+        if debug or hooks:
+            start = time.time()
 
-    return resp
+        try:
+            resp = send(method, uri, **kwargs)
+        except Exception, e:
+            # Only connection errors may be retried. Anything else, like
+            # running out of time waiting for a free connection, ends the
+            # request but still reaches the log and the hooks.
+            exc_info = sys.exc_info()
+            if debug:
+                logger.debug("%s %s failed after %.1fms: %r", method, uri,
+                             (time.time() - start) * 1000, e)
+            if hooks:
+                timings = Timings(None, None, time.time() - start)
+                event = event._replace(timings=timings, error=e)
+            retryable = isinstance(e, (socket.error, httplib.HTTPException,
+                                       httplib2.ServerNotFoundError,
+                                       httplib2.SSLHandshakeError))
+            if not retryable or policy is None or \
+                    not policy.should_retry(method, attempt, e):
+                if hooks:
+                    hooks.fire("on_error", event)
+                raise exc_info[0], exc_info[1], exc_info[2]
+            error = e
+        else:
+            if debug:
+                log_response(method, resp, time.time() - start, resource,
+                             body_limit)
+            if hooks:
+                event = event._replace(status=resp.status_code,
+                                       bytes=response_size(resp),
+                                       timings=resp.timings)
+                hooks.fire("after_response", event)
+
+            if limiter is not None:
+                if resp.status_code == 429:
+                    limiter.throttled(method, resource)
+                elif resp.ok:
+                    limiter.succeeded(method, resource)
+
+            if resp.ok:
+                return resp
+
+            try:
+                error = json.loads(resp.content)
+                message = "%s: %s" % (error["code"], error["message"])
+            except:
+                message = resp.content
+
+            error = TwilioRestException(resp.status_code, resp.url, message)
+            if hooks:
+                event = event._replace(error=error)
+            if policy is None or not policy.should_retry(method, attempt,
+                                                         error):
+                if hooks:
+                    hooks.fire("on_error", event)
+                raise error
+
+        delay = policy.delay(attempt)
+        if deadline is not None and time.time() + delay >= expires:
+            if hooks:
+                hooks.fire("on_error", event)
+            raise error
+
+        if hooks:
+            hooks.fire("on_retry", event)
+
+        policy.retry(delay)
+        attempt += 1
 
 
 class Resource(object):
@@ -179,9 +1867,10 @@ class Resource(object):
 
     name = "Resource"
 
-    def __init__(self, base_uri, auth):
+    def __init__(self, base_uri, auth, transport=None):
         self.base_uri = base_uri
         self.auth = auth
+        self.transport = transport
 
     def __eq__(self, other):
         return (isinstance(other, self.__class__)
@@ -190,17 +1879,37 @@ class Resource(object):
     def __ne__(self, other):
         return not self.__eq__(other)
 
+    def __getstate__(self):
+        # The transport holds locks and open connections, so it isn't
+        # pickled. An unpickled resource sends requests without one.
+        state = self.__dict__.copy()
+        state["transport"] = None
+        return state
+
+    def __deepcopy__(self, memo):
+        # Copies share the transport instead of dropping it
+        memo[id(self.transport)] = self.transport
+        copied = self.__class__.__new__(self.__class__)
+        memo[id(self)] = copied
+        copied.__dict__.update(copy.deepcopy(self.__dict__, memo))
+        return copied
+
     def request(self, method, uri, **kwargs):
         """
         Send an HTTP request to the resource.
 
         Raise a TwilioRestException
         """
+        if self.transport is not None:
+            kwargs["transport"] = self.transport
+            kwargs["resource"] = self.__class__
+
         resp = make_twilio_request(method, uri, auth=self.auth, **kwargs)
 
-        logging.debug(resp.content)
+        if kwargs.get("stream"):
+            return resp, None
 
-        if method == "DELETE":
+        if method == "DELETE" or resp.status_code == 304:
             return resp, {}
         else:
             return resp, json.loads(resp.content)
@@ -211,15 +1920,67 @@ class Resource(object):
         return "%s/%s" % format
 
 
+def subresource_key(resource):
+    """
+    Return the attribute name a subresource class is available under
+    """
+    try:
+        return resource.key
+    except AttributeError:
+        return resource.name.lower()
+
+
+def record_type(instance):
+    """
+    Return a read-only namedtuple type with the known fields of the given
+    InstanceResource class. Types are created once and cached.
+    """
+    try:
+        return record_types[instance]
+    except KeyError:
+        pass
+
+    if not instance.fields:
+        raise TwilioException("%s has no known fields" % instance.__name__)
+
+    record = namedtuple("%sRecord" % instance.__name__, instance.fields)
+    record.keys = tuple("from" if f == "from_" else f for f in record._fields)
+    record_types[instance] = record
+    return record
+
+
+record_types = {}
+
+
 class InstanceResource(Resource):
 
+    # Attributes returned by the API, used to build compact records
+    fields = ()
+
+    # List resources nested under this instance. Each one is created the
+    # first time its key is accessed as an attribute, then cached.
     subresources = []
 
     def __init__(self, parent, sid):
         self.parent = parent
         self.name = sid
         super(InstanceResource, self).__init__(parent.uri,
-            parent.auth)
+            parent.auth, parent.transport)
+
+    def __getattr__(self, name):
+        for resource in self.subresources:
+            if subresource_key(resource) == name:
+                return self.load_subresource(resource)
+        raise AttributeError("%r object has no attribute %r" %
+                             (self.__class__.__name__, name))
+
+    def __eq__(self, other):
+        if not isinstance(other, self.__class__):
+            return False
+
+        keys = set(subresource_key(r) for r in self.subresources)
+        loaded = lambda d: dict((k, v) for k, v in d.items() if k not in keys)
+        return loaded(self.__dict__) == loaded(other.__dict__)
 
     def load(self, entries):
         if "from" in entries.keys():
@@ -231,13 +1992,22 @@ class InstanceResource(Resource):
 
         self.__dict__.update(entries)
 
+    def load_subresource(self, resource):
+        """
+        Create the given subresource and cache it on this instance
+        """
+        list_resource = resource(self.uri, self.parent.auth,
+                                 self.parent.transport)
+        self.__dict__[subresource_key(resource)] = list_resource
+        return list_resource
+
     def load_subresources(self):
         """
-        Load all subresources
+        Load all subresources. Subresources are otherwise loaded lazily, the
+        first time they are accessed.
         """
         for resource in self.subresources:
-            list_resource = resource(self.uri, self.parent.auth)
-            self.__dict__[list_resource.key] = list_resource
+            self.load_subresource(resource)
 
     def update_instance(self, **kwargs):
         a = self.parent.update(self.name, **kwargs)
@@ -252,6 +2022,12 @@ class ListResource(Resource):
     name = "Resources"
     instance = InstanceResource
 
+    # Names of the list() arguments bounding a date range, used by export()
+    date_filters = None
+
+    # Whether get() may serve instances from the transport's cache
+    cacheable = False
+
     def __init__(self, *args, **kwargs):
         super(ListResource, self).__init__(*args, **kwargs)
 
@@ -264,16 +2040,91 @@ class ListResource(Resource):
         """Return an instance resource """
         return self.get_instance(sid)
 
+    @property
+    def cache(self):
+        """
+        The cache for instances of this resource, or None
+        """
+        if self.transport is None or not self.cacheable:
+            return None
+        return self.transport.cache
+
     def get_instance(self, sid):
         """Request the specified instance resource"""
         uri = "%s/%s" % (self.uri, sid)
-        resp, item = self.request("GET", uri)
+        cache = self.cache
+
+        if cache is None:
+            resp, item = self.request("GET", uri)
+        else:
+            item = self.get_cached(cache, uri)
+
         return self.load_instance(item)
 
-    def get_instances(self, params=None, page=None, page_size=None):
+    def get_cached(self, cache, uri):
+        """
+        Return the item at uri from the cache while it is fresh. A stale item
+        is revalidated with a conditional request when Twilio sent an ETag or
+        Last-Modified header for it.
+        """
+        entry = cache.get(uri)
+        now = time.time()
+
+        if entry is not None and entry["expires"] > now:
+            return copy.deepcopy(entry["item"])
+
+        headers = {}
+        if entry is not None:
+            if entry["etag"]:
+                headers["If-None-Match"] = entry["etag"]
+            if entry["last_modified"]:
+                headers["If-Modified-Since"] = entry["last_modified"]
+
+        resp, item = self.request("GET", uri, headers=headers)
+
+        if resp.status_code == 304:
+            item = entry["item"]
+            etag = resp.headers.get("etag", entry["etag"])
+            last_modified = resp.headers.get("last-modified",
+                                             entry["last_modified"])
+        else:
+            etag = resp.headers.get("etag")
+            last_modified = resp.headers.get("last-modified")
+
+        entry = {
+            "item": item,
+            "etag": etag,
+            "last_modified": last_modified,
+            "expires": now + cache.ttl,
+            }
+
+        # Entries that can be revalidated outlive their ttl, but still
+        # expire so a cache without a size limit can be pruned
+        if etag or last_modified:
+            cache.set(uri, entry, cache.ttl + cache.stale_ttl)
+        else:
+            cache.set(uri, entry, cache.ttl)
+
+        return copy.deepcopy(item)
+
+    def get_instances(self, params=None, page=None, page_size=None,
+                      limit=None, prefetch=0, compact=False, stream=False,
+                      incremental=False):
         """
         Query the list resource for a list of InstanceResources
+
+        If compact is True, return read-only records instead, see
+        :meth:`load_record`. If stream is True, return a generator over every
+        page instead, see :meth:`iter_instances`. If incremental is True,
+        records are parsed from the response as it is read, see
+        :meth:`iter_page_items`.
         """
+        if stream:
+            return self.iter_instances(params, page=page, page_size=page_size,
+                                       limit=limit, prefetch=prefetch,
+                                       compact=compact,
+                                       incremental=incremental)
+
         params = params or {}
 
         if page is not None:
@@ -282,12 +2133,148 @@ class ListResource(Resource):
         if page_size is not None:
             params["PageSize"] = page_size
 
+        load = self.load_record if compact else self.load_instance
+
+        if incremental:
+            items = self.iter_page_items(self.uri, {}, params=params)
+            return [load(ir) for ir in items]
+
         resp, page = self.request("GET", self.uri, params=params)
 
         if self.key not in page:
             raise TwilioException("Key %s not present in response" % self.key)
 
-        return [self.load_instance(ir) for ir in page[self.key]]
+        return [load(ir) for ir in page[self.key]]
+
+    def iter_page_items(self, uri, fields, **kwargs):
+        """
+        Request a page and yield its records one at a time as they are parsed
+        from the response, so the whole page is never held in memory. The
+        other fields of the page are stored in fields once every record has
+        been yielded.
+        """
+        resp, page = self.request("GET", uri, stream=True, **kwargs)
+
+        try:
+            for item in JsonStream(resp.read).iter_items(self.key, fields):
+                yield item
+        finally:
+            resp.close()
+
+    def iter_page_streams(self, params=None, page=None, page_size=None):
+        """
+        Like :meth:`iter_pages`, but yield a generator over the records of
+        each page, see :meth:`iter_page_items`. Each generator must be
+        exhausted before the next one is requested.
+        """
+        params = dict(params or {})
+
+        if page is not None:
+            params["Page"] = page
+
+        if page_size is not None:
+            params["PageSize"] = page_size
+
+        uri, kwargs = self.uri, {"params": params}
+
+        while True:
+            fields = {}
+            yield self.iter_page_items(uri, fields, **kwargs)
+
+            next_page_uri = fields.get("next_page_uri")
+            if not next_page_uri:
+                return
+
+            # next_page_uri already includes the .json extension
+            uri = urljoin(self.uri, next_page_uri)
+            kwargs = {"headers": {"Accept": "application/json"}}
+
+    def iter_pages(self, params=None, page=None, page_size=None):
+        """
+        Lazily yield the list of records on every page of the list resource,
+        following the next_page_uri of each page until the last one.
+        """
+        params = dict(params or {})
+
+        if page is not None:
+            params["Page"] = page
+
+        if page_size is not None:
+            params["PageSize"] = page_size
+
+        resp, page = self.request("GET", self.uri, params=params)
+
+        while True:
+            if self.key not in page:
+                raise TwilioException("Key %s not present in response" %
+                                      self.key)
+
+            yield page.pop(self.key)
+
+            next_page_uri = page.get("next_page_uri")
+            if not next_page_uri:
+                return
+
+            # next_page_uri already includes the .json extension
+            uri = urljoin(self.uri, next_page_uri)
+            headers = {"Accept": "application/json"}
+            resp, page = self.request("GET", uri, headers=headers)
+
+    def iter_instances(self, params=None, page=None, page_size=None,
+                       limit=None, prefetch=0, compact=False,
+                       incremental=False):
+        """
+        Lazily yield InstanceResources from every page of the list resource
+
+        :param int limit: Stop after yielding this many instances
+        :param int prefetch: Number of pages to download ahead on a
+                             background thread while the current page is
+                             being consumed. 0 disables prefetching.
+        :param bool compact: Yield read-only records instead of
+                             InstanceResources, see :meth:`load_record`
+        :param bool incremental: Parse records from each page as it is read
+                                 from the socket instead of loading the
+                                 whole page first. Can't be combined with
+                                 prefetch.
+
+        Prefetching pages uses the timeout, deadline and retry policy in
+        effect when iter_instances is called.
+        """
+        load = self.load_record if compact else self.load_instance
+        transport = self.transport if prefetch > 0 else None
+        settings = transport.settings() if transport is not None else None
+
+        def instances():
+            if incremental:
+                if prefetch > 0:
+                    raise ValueError("prefetch can't be used with "
+                                     "incremental")
+                pages = self.iter_page_streams(params, page=page,
+                                               page_size=page_size)
+            else:
+                pages = self.iter_pages(params, page=page,
+                                        page_size=page_size)
+
+            if prefetch > 0:
+                if transport is not None:
+                    pages = transport.bind_iter(pages, settings)
+                pages = prefetch_iter(pages, prefetch)
+
+            count = 0
+            try:
+                for records in pages:
+                    for ir in records:
+                        if limit is not None and count >= limit:
+                            return
+                        count += 1
+                        yield load(ir)
+
+                    if limit is not None and count >= limit:
+                        return
+            finally:
+                pages.close()
+
+        return instances()
 
     def create_instance(self, body):
         """
@@ -311,6 +2298,10 @@ class ListResource(Resource):
         """
         uri = "%s/%s" % (self.uri, sid)
         resp, instance = self.request("DELETE", uri)
+
+        if self.cache is not None:
+            self.cache.delete(uri)
+
         return resp.status_code == 204
 
     def update_instance(self, sid, body):
@@ -322,37 +2313,160 @@ class ListResource(Resource):
         """
         uri = "%s/%s" % (self.uri, sid)
         resp, entry = self.request("POST", uri, data=body)
+
+        if self.cache is not None:
+            self.cache.delete(uri)
+
         return self.load_instance(entry)
 
-    def count(self):
+    def get_count(self, params=None):
         """
-        Return the number of instance resources contained in this list resource
+        Return the total number of instances matching params, requesting a
+        single record page so almost nothing is downloaded
         """
-        resp, page = self.request("GET", self.uri)
+        params = dict(params or {})
+        params["PageSize"] = 1
+
+        resp, page = self.request("GET", self.uri, params=params)
         return page["total"]
 
-    def iter(self, **kwargs):
+    def list_params(self):
+        """
+        Return the query parameters list() sends for its filters. List
+        resources whose list() takes filters override this.
+        """
+        return {}
+
+    def count(self, **kwargs):
+        """
+        Return the number of instance resources contained in this list resource
+
+        Accepts the same filters as list()
+        """
+        return self.get_count(self.list_params(**kwargs))
+
+    def iter(self, page_size=None, limit=None, prefetch=0, compact=False,
+             incremental=False, **kwargs):
         """
         Return all instance resources using an iterator
         Can only be called on classes which implement list()
 
-        TODO Make this use the next_url instead
-        """
-        p = 0
-        try:
-            while True:
-                for r in self.list(page=p, **kwargs):
-                    yield r
-                p += 1
-        except TwilioRestException:
-            pass
+        Pages are requested one at a time by following the next_page_uri of
+        the previous page, and instances are yielded as they are loaded.
+
+        :param int page_size: Number of instances to request per page
+        :param int limit: Stop after yielding this many instances
+        :param int prefetch: Number of pages to download ahead on a
+                             background thread while the caller processes the
+                             current page. Defaults to 0, no prefetching.
+        :param bool compact: Yield read-only records instead of instance
+                             resources, see :meth:`load_record`
+        :param bool incremental: Parse instances from each page as it is
+                                 read from the socket, so a page never has
+                                 to fit in memory. Can't be combined with
+                                 prefetch.
+        """
+        return self.list(page_size=page_size, limit=limit, prefetch=prefetch,
+                         compact=compact, stream=True, incremental=incremental,
+                         **kwargs)
+
+    def export(self, start, end, days=1, workers=4, ordered=True,
+               page_size=None, **kwargs):
+        """
+        Return an iterator over every instance resource between the dates
+        start and end, inclusive. The range is split into windows of days
+        days which are downloaded concurrently.
+        Can only be called on classes which define date_filters
+
+        :param start: First date to export, as a date or YYYY-MM-DD string
+        :param end: Last date to export, as a date or YYYY-MM-DD string
+        :param int days: Number of days covered by each window
+        :param int workers: Maximum number of windows downloaded at once
+        :param bool ordered: If True, yield instances in the order
+                             :meth:`iter` would, most recent window first. If
+                             False, yield instances as soon as they arrive.
+        :param int page_size: Number of instances to request per page
+
+        Any other keyword arguments are passed to list() as filters. Windows
+        are downloaded with the timeout, deadline and retry policy in effect
+        when export is called.
+        """
+        if self.date_filters is None:
+            raise TwilioException("%s can not be exported by date" % self.name)
+
+        after, before = self.date_filters
+        transport = self.transport
+        settings = transport.settings() if transport is not None else None
+
+        def window_iter(first, last):
+            filters = dict(kwargs)
+            filters[after] = parse_date(first)
+            filters[before] = parse_date(last)
+
+            def source():
+                instances = self.iter(page_size=page_size, **filters)
+                if transport is None:
+                    return instances
+                return transport.bind_iter(instances, settings)
+
+            return source
+
+        sources = [window_iter(first, last) for first, last
+                   in date_windows(start, end, days)]
+
+        return chain_concurrently(sources, workers=workers, ordered=ordered)
+
+    def bulk_create(self, requests, workers=10, retry=None):
+        """
+        Call create() for every item of requests concurrently, yielding a
+        :class:`BulkResult` for each in completion order. Items are tuples of
+        positional arguments or dicts of keyword arguments.
+
+        Requests wait on the client's rate limiter like any other, and use
+        the timeout, deadline and retry policy in effect when bulk_create is
+        called.
+
+        :param retry: The :class:`RetryPolicy` used instead of the client's
+                      for these requests. None keeps the client's policy.
+        """
+        def send(request):
+            if isinstance(request, dict):
+                return self.create(**request)
+            return self.create(*request)
+
+        create = send
+        if self.transport is not None:
+            timeout, deadline, policy = self.transport.settings()
+            if retry is not None:
+                policy = retry
+            create = self.transport.bind(send, (timeout, deadline, policy))
+
+        def results():
+            for request, future in map_concurrently(create, requests,
+                                                    workers):
+                error = future.exception()
+                if error is None:
+                    yield BulkResult(request, future.result(), None)
+                else:
+                    yield BulkResult(request, None, error)
+
+        return results()
 
     def load_instance(self, data):
         instance = self.instance(self, data["sid"])
         instance.load(data)
-        instance.load_subresources()
         return instance
 
+    def load_record(self, data):
+        """
+        Return a compact, read-only record holding the known fields of the
+        instance resource. Records are namedtuples, so they use a fraction of
+        the memory of an InstanceResource, but have no methods or
+        subresources. Fields missing from data are None.
+        """
+        record = record_type(self.instance)
+        return record._make([data.get(k) for k in record.keys])
+
 
 class AvailablePhoneNumber(InstanceResource):
     """ An available phone number resource """
@@ -374,8 +2488,8 @@ class AvailablePhoneNumbers(ListResource):
 
     types = {"local": "Local", "tollfree": "TollFree"}
 
-    def __init__(self, base_uri, auth, phone_numbers):
-        super(AvailablePhoneNumbers, self).__init__(base_uri, auth)
+    def __init__(self, base_uri, auth, phone_numbers, transport=None):
+        super(AvailablePhoneNumbers, self).__init__(base_uri, auth, transport)
         self.phone_numbers = phone_numbers
 
     def get(self, sid):
@@ -407,12 +2521,16 @@ class AvailablePhoneNumbers(ListResource):
     def load_instance(self, data):
         instance = self.instance(self.phone_numbers)
         instance.load(data)
-        instance.load_subresources()
         return instance
 
 
 class Transcription(InstanceResource):
-    pass
+
+    fields = (
+        "sid", "account_sid", "date_created", "date_updated", "status", "type",
+        "recording_sid", "duration", "transcription_text", "price",
+        "api_version", "uri",
+        )
 
 
 class Transcriptions(ListResource):
@@ -429,6 +2547,11 @@ class Transcriptions(ListResource):
 
 class Recording(InstanceResource):
 
+    fields = (
+        "sid", "account_sid", "call_sid", "duration", "date_created",
+        "date_updated", "api_version", "uri",
+        )
+
     subresources = [
         Transcriptions,
         ]
@@ -452,7 +2575,6 @@ class Recordings(ListResource):
     name = "Recordings"
     instance = Recording
 
-    @normalize_dates
     def list(self, call_sid=None, before=None, after=None, **kwargs):
         """
         Returns a page of :class:`Recording` resources as a list.
@@ -462,12 +2584,20 @@ class Recordings(ListResource):
         :param date before: Only list recordings logger before this datetime
         :param call_sid: Only list recordings from this :class:`Call`
         """
-        params = transform_params({
+        params = self.list_params(call_sid=call_sid, before=before,
+                                  after=after)
+        return self.get_instances(params=params, **kwargs)
+
+    @normalize_dates
+    def list_params(self, call_sid=None, before=None, after=None):
+        """
+        Return the query parameters list() sends for these filters
+        """
+        return transform_params({
             "CallSid": call_sid,
             "DateCreated<": before,
             "DateCreated>": after,
             })
-        return self.get_instances(params=params)
 
     def delete(self, sid):
         """
@@ -478,6 +2608,13 @@ class Recordings(ListResource):
 
 class Notification(InstanceResource):
 
+    fields = (
+        "sid", "account_sid", "call_sid", "log", "error_code", "more_info",
+        "message_text", "message_date", "response_body", "request_method",
+        "request_url", "request_variables", "response_headers", "date_created",
+        "date_updated", "api_version", "uri",
+        )
+
     def delete(self):
         """
         Delete this notification
@@ -490,7 +2627,6 @@ class Notifications(ListResource):
     name = "Notifications"
     instance = Notification
 
-    @normalize_dates
     def list(self, before=None, after=None, log_level=None, **kwargs):
         """
         Returns a page of :class:`Notification` resources as a list.
@@ -504,13 +2640,21 @@ class Notifications(ListResource):
         :param date before: Only list notifications logger before this datetime
         :param log_level: If 1, only shows errors. If 0, only show warnings
         """
-        params = transform_params({
-                "MessageDate<": before,
-                "MessageDate>": after,
-                "LogLevel": log_level,
-                })
+        params = self.list_params(before=before, after=after,
+                                  log_level=log_level)
         return self.get_instances(params=params, **kwargs)
 
+    @normalize_dates
+    def list_params(self, before=None, after=None, log_level=None):
+        """
+        Return the query parameters list() sends for these filters
+        """
+        return transform_params({
+            "MessageDate<": before,
+            "MessageDate>": after,
+            "LogLevel": log_level,
+            })
+
     def delete(self, sid):
         """
         Delete a given Notificiation
@@ -530,6 +2674,14 @@ class Call(InstanceResource):
     QUEUED = "queued"
     RINGING = "ringing"
 
+    fields = (
+        "sid", "parent_call_sid", "date_created", "date_updated",
+        "account_sid", "to", "from_", "phone_number_sid", "status",
+        "start_time", "end_time", "duration", "price", "direction",
+        "answered_by", "forwarded_from", "caller_name", "api_version",
+        "annotation", "group_sid", "uri",
+        )
+
     subresources = [
         Notifications,
         Recordings,
@@ -558,8 +2710,8 @@ class Calls(ListResource):
 
     name = "Calls"
     instance = Call
+    date_filters = ("started_after", "started_before")
 
-    @normalize_dates
     def list(self, to=None, from_=None, status=None, ended_after=None,
              ended_before=None, ended=None, started_before=None,
              started_after=None, started=None, **kwargs):
@@ -570,7 +2722,21 @@ class Calls(ListResource):
         :param date after: Only list calls started after this datetime
         :param date before: Only list calls started before this datetime
         """
-        params = transform_params({
+        params = self.list_params(to=to, from_=from_, status=status,
+                                  ended_after=ended_after,
+                                  ended_before=ended_before, ended=ended,
+                                  started_before=started_before,
+                                  started_after=started_after, started=started)
+        return self.get_instances(params=params, **kwargs)
+
+    @normalize_dates
+    def list_params(self, to=None, from_=None, status=None, ended_after=None,
+                    ended_before=None, ended=None, started_before=None,
+                    started_after=None, started=None):
+        """
+        Return the query parameters list() sends for these filters
+        """
+        return transform_params({
             "To": to,
             "From": from_,
             "Status": status,
@@ -581,7 +2747,6 @@ class Calls(ListResource):
             "EndTime>": ended_after,
             "EndTime": ended,
             })
-        return self.get_instances(params=params, **kwargs)
 
     def create(self, to, from_, url, method=None, fallback_url=None,
                fallback_method=None, status_callback=None, status_method=None,
@@ -606,6 +2771,29 @@ class Calls(ListResource):
             })
         return self.create_instance(params)
 
+    def create_many(self, calls, workers=10, retry=None):
+        """
+        Place many calls concurrently. Return an iterator of
+        :class:`BulkResult` in the order the calls are created. A failed call
+        does not stop the rest; its result holds the exception instead.
+
+        Calls are paced by the client's rate limiter, e.g. a
+        :class:`RateLimiter` with a budget for "Calls".
+
+        :param calls: An iterable of (to, from_, url) tuples, or dicts of
+                      :meth:`create` arguments. It is consumed lazily.
+        :param int workers: Maximum number of calls being placed at once
+        :param retry: The :class:`RetryPolicy` for these calls. Defaults to
+                      retrying calls Twilio rejected with a 429 or 503 status
+                      up to five times. Socket errors are not retried, since
+                      the call may have been placed.
+        """
+        if retry is None:
+            retry = RetryPolicy(attempts=6, backoff=1.0,
+                                statuses=THROTTLED_STATUSES,
+                                methods=("POST",), connection_errors=False)
+        return self.bulk_create(calls, workers, retry=retry)
+
     def update(self, sid, status=None, method=None, url=None):
         params = transform_params({
             "Status": status,
@@ -637,6 +2825,11 @@ class Calls(ListResource):
 
 class CallerId(InstanceResource):
 
+    fields = (
+        "sid", "account_sid", "friendly_name", "phone_number", "date_created",
+        "date_updated", "uri",
+        )
+
     def delete(self):
         """
         Deletes this caller ID from the account.
@@ -656,6 +2849,7 @@ class CallerIds(ListResource):
     name = "OutgoingCallerIds"
     key = "outgoing_caller_ids"
     instance = CallerId
+    cacheable = True
 
     def delete(self, sid):
         """
@@ -668,11 +2862,18 @@ class CallerIds(ListResource):
         :param phone_number: Show caller ids with this phone number.
         :param friendly_name: Show caller ids with this friendly name.
         """
-        params = transform_params({
+        params = self.list_params(phone_number=phone_number,
+                                  friendly_name=friendly_name)
+        return self.get_instances(params=params, **kwargs)
+
+    def list_params(self, phone_number=None, friendly_name=None):
+        """
+        Return the query parameters list() sends for these filters
+        """
+        return transform_params({
             "PhoneNumber": phone_number,
             "FrienldyName": friendly_name,
             })
-        return self.get_instances(params=params, **kwargs)
 
     def update(self, sid, friendly_name=None):
         """
@@ -720,6 +2921,15 @@ class CallerIds(ListResource):
 
 class PhoneNumber(InstanceResource):
 
+    fields = (
+        "sid", "account_sid", "friendly_name", "phone_number", "voice_url",
+        "voice_method", "voice_fallback_url", "voice_fallback_method",
+        "voice_caller_id_lookup", "date_created", "date_updated", "sms_url",
+        "sms_method", "sms_fallback_url", "sms_fallback_method",
+        "capabilities", "status_callback", "status_callback_method",
+        "api_version", "uri",
+        )
+
     def trasfer(self, account_sid):
         """
         Transfer the phone number with sid from the current account to another
@@ -750,11 +2960,12 @@ class PhoneNumbers(ListResource):
     name = "IncomingPhoneNumbers"
     key = "incoming_phone_numbers"
     instance = PhoneNumber
+    cacheable = True
 
-    def __init__(self, base_uri, auth):
-        super(PhoneNumbers, self).__init__(base_uri, auth)
+    def __init__(self, base_uri, auth, transport=None):
+        super(PhoneNumbers, self).__init__(base_uri, auth, transport)
         self.available_phone_numbers = \
-            AvailablePhoneNumbers(base_uri, auth, self)
+            AvailablePhoneNumbers(base_uri, auth, self, transport)
 
     def delete(self, sid):
         """
@@ -774,12 +2985,19 @@ class PhoneNumbers(ListResource):
 
         You can specify partial numbers and use '*' as a wildcard.
         """
-        params = transform_params({
-               "PhoneNumber": phone_number,
-               "FriendlyName": friendly_name,
-               })
+        params = self.list_params(phone_number=phone_number,
+                                  friendly_name=friendly_name)
         return self.get_instances(params=params, **kwargs)
 
+    def list_params(self, phone_number=None, friendly_name=None):
+        """
+        Return the query parameters list() sends for these filters
+        """
+        return transform_params({
+            "PhoneNumber": phone_number,
+            "FriendlyName": friendly_name,
+            })
+
     def purchase(self, phone_number=None, area_code=None, voice_url=None,
                  voice_method=None, voice_fallback_url=None,
                  voice_fallback_method=None, status_callback_method=None,
@@ -906,14 +3124,19 @@ class Sms(object):
     name = "SMS"
     key = "sms"
 
-    def __init__(self, base_uri, auth):
+    def __init__(self, base_uri, auth, transport=None):
         self.uri = "%s/SMS" % base_uri
-        self.messages = SmsMessages(self.uri, auth)
-        self.short_codes = ShortCodes(self.uri, auth)
+        self.messages = SmsMessages(self.uri, auth, transport)
+        self.short_codes = ShortCodes(self.uri, auth, transport)
 
 
 class SmsMessage(InstanceResource):
-    pass
+
+    fields = (
+        "sid", "date_created", "date_updated", "date_sent", "account_sid",
+        "to", "from_", "body", "status", "direction", "price", "api_version",
+        "uri",
+        )
 
 
 class SmsMessages(ListResource):
@@ -921,6 +3144,7 @@ class SmsMessages(ListResource):
     name = "Messages"
     key = "sms_messages"
     instance = SmsMessage
+    date_filters = ("after", "before")
 
     def create(self, to=None, from_=None, body=None, status_callback=None,
                application_sid=None):
@@ -941,6 +3165,24 @@ class SmsMessages(ListResource):
             })
         return self.create_instance(params)
 
+    def create_many(self, messages, workers=10, retry=None):
+        """
+        Send many SMS Messages concurrently. Return an iterator of
+        :class:`BulkResult` in the order the messages are sent. A failed
+        message does not stop the rest of the batch; its result holds the
+        exception instead.
+
+        :param messages: An iterable of (to, from_, body, status_callback)
+                         tuples, or dicts of :meth:`create` arguments. It is
+                         consumed lazily.
+        :param int workers: Maximum number of messages being sent at once.
+                            Requests share the client's connection pool, so
+                            keep this at most its pool_size.
+        :param retry: The :class:`RetryPolicy` for these messages. None keeps
+                      the client's policy, which doesn't retry POSTs.
+        """
+        return self.bulk_create(messages, workers, retry=retry)
+
     def list(self, to=None, from_=None, before=None, after=None, **kwargs):
         """
         Returns a page of :class:`SMSMessage` resources as a list. For
@@ -951,17 +3193,30 @@ class SmsMessages(ListResource):
         :param date after: Only list recordings logged after this datetime
         :param date before: Only list recordings logger before this datetime
         """
-        params = transform_params({
+        params = self.list_params(to=to, from_=from_, before=before,
+                                  after=after)
+        return self.get_instances(params=params, **kwargs)
+
+    def list_params(self, to=None, from_=None, before=None, after=None):
+        """
+        Return the query parameters list() sends for these filters
+        """
+        return transform_params({
             "To": to,
             "From": from_,
             "DateSent<": before,
             "DateSent>": after,
             })
-        return self.get_instances(params=params, **kwargs)
 
 
 class ShortCode(InstanceResource):
 
+    fields = (
+        "sid", "date_created", "date_updated", "friendly_name", "account_sid",
+        "short_code", "api_version", "sms_url", "sms_method",
+        "sms_fallback_url", "sms_fallback_method", "uri",
+        )
+
     def update(self, **kwargs):
         return self.parent.update(self.name, **kwargs)
 
@@ -971,6 +3226,7 @@ class ShortCodes(ListResource):
     name = "ShortCodes"
     key = "short_codes"
     instance = ShortCode
+    cacheable = True
 
     def list(self, short_code=None, friendly_name=None, **kwargs):
         """
@@ -983,11 +3239,18 @@ class ShortCodes(ListResource):
         :param friendly_name: Only show the ShortCode resources with friendly
                               names that exactly match this name.
         """
-        params = transform_params({
+        params = self.list_params(short_code=short_code,
+                                  friendly_name=friendly_name)
+        return self.get_instances(params=params, **kwargs)
+
+    def list_params(self, short_code=None, friendly_name=None):
+        """
+        Return the query parameters list() sends for these filters
+        """
+        return transform_params({
             "ShortCode": short_code,
             "FriendlyName": friendly_name,
             })
-        return self.get_instances(params=params, **kwargs)
 
     def update(self, sid, friendly_name=None, api_version=None, url=None,
                method=None, fallback_url=None, fallback_method=None):
@@ -1022,6 +3285,12 @@ class Participant(InstanceResource):
 
     id_key = "call_sid"
 
+    fields = (
+        "call_sid", "conference_sid", "account_sid", "muted",
+        "start_conference_on_enter", "end_conference_on_exit", "date_created",
+        "date_updated", "uri",
+        )
+
     def mute(self):
         """
         Mute the participant
@@ -1054,10 +3323,16 @@ class Participants(ListResource):
         :param conference_sid: Conference this participant is part of
         :param boolean muted: If True, only show participants who are muted
         """
-        params = transform_params({
+        params = self.list_params(muted=muted)
+        return self.get_instances(params=params, **kwargs)
+
+    def list_params(self, muted=None):
+        """
+        Return the query parameters list() sends for these filters
+        """
+        return transform_params({
             "Muted": muted,
             })
-        return self.get_instances(params=params, **kwargs)
 
     def mute(self, call_sid):
         """
@@ -1096,6 +3371,11 @@ class Participants(ListResource):
 
 class Conference(InstanceResource):
 
+    fields = (
+        "sid", "account_sid", "friendly_name", "status", "date_created",
+        "date_updated", "api_version", "uri",
+        )
+
     subresources = [
         Participants
         ]
@@ -1119,7 +3399,21 @@ class Conferences(ListResource):
         :param date created_after: List conferences created after this date
         :param date created_before: List conferences created before this date
         """
-        params = transform_params({
+        params = self.list_params(status=status, friendly_name=friendly_name,
+                                  updated_before=updated_before,
+                                  updated_after=updated_after,
+                                  created_after=created_after,
+                                  created_before=created_before,
+                                  updated=updated, created=created)
+        return self.get_instances(params=params, **kwargs)
+
+    def list_params(self, status=None, friendly_name=None, updated_before=None,
+                    updated_after=None, created_after=None,
+                    created_before=None, updated=None, created=None):
+        """
+        Return the query parameters list() sends for these filters
+        """
+        return transform_params({
             "Status": status,
             "FriendlyName": friendly_name,
             "DateUpdated<": updated_before,
@@ -1129,12 +3423,19 @@ class Conferences(ListResource):
             "DateCreated>": created_after,
             "DateCreated": created,
             })
-        return self.get_instance(params=params, **kwargs)
 
 
 class Application(InstanceResource):
     """ An application resource """
 
+    fields = (
+        "sid", "date_created", "date_updated", "account_sid", "friendly_name",
+        "api_version", "voice_url", "voice_method", "voice_fallback_url",
+        "voice_fallback_method", "status_callback", "status_callback_method",
+        "voice_caller_id_lookup", "sms_url", "sms_method", "sms_fallback_url",
+        "sms_fallback_method", "sms_status_callback", "uri",
+        )
+
     def update(self, **kwargs):
         """
         Update this application
@@ -1152,6 +3453,7 @@ class Applications(ListResource):
 
     name = "Applications"
     instance = Application
+    cacheable = True
 
     def list(self, friendly_name=None, **kwargs):
         """
@@ -1160,11 +3462,17 @@ class Applications(ListResource):
 
         :param date friendly_name: List applications with this friendly name
         """
-        params = transform_params({
-                "FriendlyName": friendly_name,
-                })
+        params = self.list_params(friendly_name=friendly_name)
         return self.get_instances(params=params, **kwargs)
 
+    def list_params(self, friendly_name=None):
+        """
+        Return the query parameters list() sends for these filters
+        """
+        return transform_params({
+            "FriendlyName": friendly_name,
+            })
+
     def create(self, friendly_name=None, api_version=None, voice_url=None,
                voice_method=None, voice_fallback_url=None,
                voice_fallback_method=None, status_callback=None,
@@ -1255,7 +3563,7 @@ class Applications(ListResource):
                 "SmsFallbackMethod": sms_fallback_method,
                 "SmsStatusCallback": sms_status_callback,
                 })
-        return self.update_instance(params)
+        return self.update_instance(sid, params)
 
     def delete(self, sid):
         """
@@ -1271,6 +3579,11 @@ class Account(InstanceResource):
     SUSPENDED = "suspended"
     CLOSED = "closed"
 
+    fields = (
+        "sid", "friendly_name", "status", "date_created", "date_updated",
+        "auth_token", "type", "uri",
+        )
+
     subresources = [
         Applications,
         Notifications,
@@ -1327,12 +3640,18 @@ class Accounts(ListResource):
         :param date friendly_name: Only list accounts with this friendly name
         :param date status: Only list accounts with this status
         """
-        params = transform_params({
-                "FriendlyName": friendly_name,
-                "Status": status,
-                })
+        params = self.list_params(friendly_name=friendly_name, status=status)
         return self.get_instances(params=params, **kwargs)
 
+    def list_params(self, friendly_name=None, status=None):
+        """
+        Return the query parameters list() sends for these filters
+        """
+        return transform_params({
+            "FriendlyName": friendly_name,
+            "Status": status,
+            })
+
     def update(self, sid, friendly_name=None, status=None):
         """
         :param sid: Account identifier
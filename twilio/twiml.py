@@ -2,31 +2,171 @@
 Make sure to check out the TwiML overview and tutorial
 """
 
+import re
 import xml.etree.ElementTree as ET
 
+XML_DECLARATION = u'<?xml version="1.0" encoding="utf-8"?>'
+
 
 class TwimlException(Exception):
     pass
 
 
+def escape_text(text):
+    """
+    Escape character data the way ElementTree does when serializing to
+    US-ASCII, replacing other characters with character references
+    """
+    try:
+        if "&" in text:
+            text = text.replace("&", "&amp;")
+        if "<" in text:
+            text = text.replace("<", "&lt;")
+        if ">" in text:
+            text = text.replace(">", "&gt;")
+        return text.encode("us-ascii", "xmlcharrefreplace")
+    except (TypeError, AttributeError):
+        raise TypeError("cannot serialize %r (type %s)" % (
+            text, type(text).__name__))
+
+
+def escape_attrib(text):
+    """
+    Escape an attribute value the way ElementTree does when serializing to
+    US-ASCII
+    """
+    try:
+        if "&" in text:
+            text = text.replace("&", "&amp;")
+        if "<" in text:
+            text = text.replace("<", "&lt;")
+        if ">" in text:
+            text = text.replace(">", "&gt;")
+        if "\"" in text:
+            text = text.replace("\"", "&quot;")
+        if "\n" in text:
+            text = text.replace("\n", "&#10;")
+        return text.encode("us-ascii", "xmlcharrefreplace")
+    except (TypeError, AttributeError):
+        raise TypeError("cannot serialize %r (type %s)" % (
+            text, type(text).__name__))
+
+
+SLOT_PATTERN = re.compile("\x00(\\w+)\x00")
+
+
+class Slot(str):
+    """
+    A placeholder for the text or an attribute value of a verb, filled in
+    each time a :class:`Template` is rendered. Slots can't be used where a
+    verb validates its argument, such as the voice of :class:`Say`.
+
+    :param name: The keyword argument of :meth:`Template.render` that
+                 supplies the value
+    """
+
+    def __new__(cls, name):
+        if not re.match(r"^\w+$", name):
+            raise TwimlException("Invalid slot name %r" % name)
+        slot = str.__new__(cls, "\x00%s\x00" % name)
+        slot.name = name
+        return slot
+
+
+class Template(object):
+    """
+    A TwiML document compiled once and rendered many times with different
+    values for its :class:`Slot` placeholders.
+
+    .. code-block:: python
+
+        r = Response()
+        g = r.gather(action=Slot("action"), numDigits=1)
+        g.say(Slot("prompt"))
+        menu = Template(r)
+
+        menu.render(action="/menu", prompt="Press 1 for sales")
+
+    :param verb: The verb tree to compile, usually a :class:`Response`
+    :param bool xml_declaration: Include the XML declaration. Defaults to
+                                 True
+    """
+
+    def __init__(self, verb, xml_declaration=True):
+        parts = SLOT_PATTERN.split(verb.render(xml_declaration))
+
+        self.literals = parts[0::2]
+        self.slots = []
+
+        # Markup in the literals is never escaped, so the last bracket
+        # before a slot tells whether it is inside a tag
+        in_tag = False
+        for literal, name in zip(self.literals, parts[1::2]):
+            opened, closed = literal.rfind("<"), literal.rfind(">")
+            if opened != closed:
+                in_tag = opened > closed
+            self.slots.append((name, in_tag))
+
+    def render(self, **values):
+        """
+        Return the XML of the template, with each slot replaced by the
+        escaped value of the keyword argument of the same name. Empty values
+        are kept, so an empty text gives <Say></Say> rather than <Say />.
+        """
+        parts = [self.literals[0]]
+
+        for (name, in_tag), literal in zip(self.slots, self.literals[1:]):
+            try:
+                value = values[name]
+            except KeyError:
+                raise TwimlException("No value for slot %s" % name)
+
+            if in_tag:
+                parts.append(escape_attrib(str(value)))
+            else:
+                parts.append(escape_text(value))
+            parts.append(literal)
+
+        return "".join(parts)
+
+
 class Verb(object):
     """Twilio basic verb object.
+
+    Verbs use __slots__, so subclasses should declare their own (usually
+    empty) __slots__ to keep instances free of a __dict__. The names of the
+    verbs that may be nested inside a verb are a frozenset shared by every
+    instance of its class.
     """
+
+    __slots__ = ("name", "body", "verbs", "attrs", "frozen")
+
+    nestables = frozenset()
+
     def __init__(self, **kwargs):
         self.name = self.__class__.__name__
         self.body = None
-        self.nestables = None
         self.verbs = []
-        self.attrs = {}
+        # The XML of a frozen verb, keyed by xml_declaration. None until
+        # frozen.
+        self.frozen = None
 
+        # kwargs is a fresh dict, so it becomes the attributes in place
+        if "sender" in kwargs:
+            kwargs["from"] = kwargs.pop("sender")
         for k, v in kwargs.items():
-            if k == "sender":
-                k = "from"
-            if v:
-                self.attrs[k] = v
+            if not v:
+                del kwargs[k]
+        self.attrs = kwargs
 
     def __str__(self):
-        return self.toxml()
+        return self.render()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
 
     def toxml(self, xml_declaration=True):
         """
@@ -35,13 +175,83 @@ class Verb(object):
         :param bool xml_declaration: Include the XML declaration. Defaults to
                                      True
         """
+        if self.frozen is not None:
+            return self.frozen[bool(xml_declaration)]
+
         xml = ET.tostring(self.xml()).encode("utf-8")
 
         if xml_declaration:
-            return u'<?xml version="1.0" encoding="utf-8"?>' + xml
+            return XML_DECLARATION + xml
         else:
             return xml
 
+    def render(self, xml_declaration=True):
+        """
+        Return the same XML string as :meth:`toxml`, built directly from the
+        verbs in a single pass instead of through an ElementTree
+
+        :param bool xml_declaration: Include the XML declaration. Defaults to
+                                     True
+        """
+        if self.frozen is not None:
+            return self.frozen[bool(xml_declaration)]
+
+        parts = []
+        self.serialize(parts.append)
+        xml = "".join(parts)
+
+        if xml_declaration:
+            return XML_DECLARATION + xml
+        else:
+            return xml
+
+    def write(self, out, xml_declaration=True):
+        """
+        Write the XML of this verb to the file-like object out, in the same
+        form as :meth:`render`
+
+        :param bool xml_declaration: Include the XML declaration. Defaults to
+                                     True
+        """
+        if xml_declaration:
+            out.write(XML_DECLARATION)
+        self.serialize(out.write)
+
+    def serialize(self, write):
+        """
+        Call write with each piece of the escaped XML of this verb and its
+        nested verbs
+        """
+        if self.frozen is not None:
+            write(self.frozen[False])
+            return
+
+        name = self.name
+        attrs = self.attributes()
+
+        if self.body or self.verbs:
+            if self.body:
+                write("<%s%s>%s" % (name, attrs, escape_text(self.body)))
+            else:
+                write("<%s%s>" % (name, attrs))
+
+            for verb in self.verbs:
+                verb.serialize(write)
+
+            write("</%s>" % name)
+        else:
+            write("<%s%s />" % (name, attrs))
+
+    def attributes(self):
+        """
+        Return the escaped attributes of this verb as they appear in its
+        start tag
+        """
+        if not self.attrs:
+            return ""
+        return "".join([' %s="%s"' % (k, escape_attrib(str(v)))
+                        for k, v in sorted(self.attrs.items())])
+
     def xml(self):
         el = ET.Element(self.name)
 
@@ -58,8 +268,31 @@ class Verb(object):
 
         return el
 
+    def freeze(self):
+        """
+        Make this verb and every verb nested in it read-only, and serialize
+        them once. Rendering a frozen verb returns the cached XML, and
+        appending to it raises a :class:`TwimlException`. Returns the verb.
+
+        .. code-block:: python
+
+            HANGUP = Response()
+            HANGUP.hangup()
+            HANGUP.freeze()
+        """
+        if self.frozen is None:
+            for verb in self.verbs:
+                verb.freeze()
+
+            xml = self.render(xml_declaration=False)
+            self.frozen = {False: xml, True: XML_DECLARATION + xml}
+
+        return self
+
     def append(self, verb):
-        if not self.nestables or verb.name not in self.nestables:
+        if self.frozen is not None:
+            raise TwimlException("Can't append to frozen %s" % self.name)
+        if verb.name not in self.nestables:
             raise TwimlException("%s is not nestable inside %s" % \
                 (verb.name, self.name))
         self.verbs.append(verb)
@@ -68,22 +301,24 @@ class Verb(object):
 
 class Response(Verb):
     """Twilio response object."""
+    __slots__ = ()
+
+    nestables = frozenset([
+        'Say',
+        'Play',
+        'Gather',
+        'Record',
+        'Dial',
+        'Redirect',
+        'Pause',
+        'Hangup',
+        'Reject',
+        'Sms',
+        ])
+
     def __init__(self, **kwargs):
         """Version: Twilio API version e.g. 2008-08-01 """
-
         Verb.__init__(self, **kwargs)
-        self.nestables = [
-            'Say',
-            'Play',
-            'Gather',
-            'Record',
-            'Dial',
-            'Redirect',
-            'Pause',
-            'Hangup',
-            'Reject',
-            'Sms',
-            ]
 
     def say(self, text, **kwargs):
         """Return a newly created :class:`Say` verb, nested inside this
@@ -167,6 +402,106 @@ class Response(Verb):
         return self.sms(*args, **kwargs)
 
 
+class StreamingResponse(Response):
+    """A :class:`Response` that writes its verbs to a file-like object, or to
+    a write callable such as the one WSGI's start_response returns, as they
+    are added instead of keeping them in memory.
+
+    Each verb is written once the next one is added or the response is
+    closed, so a nested verb like :class:`Gather` must be complete by then.
+    Written verbs are frozen, and appending to them raises a
+    :class:`TwimlException`. Output is buffered and passed to out in chunks
+    of at least buffer_size characters.
+
+    .. code-block:: python
+
+        with twiml.StreamingResponse(out) as r:
+            for entry in history:
+                r.say(entry)
+
+    :param out: a file-like object or a callable taking a string
+    :param bool xml_declaration: Include the XML declaration. Defaults to
+                                 True
+    :param int buffer_size: Characters to buffer before writing to out
+    """
+    __slots__ = ("out", "pending", "started", "buffer", "buffered",
+                 "buffer_size")
+
+    def __init__(self, out, xml_declaration=True, buffer_size=8192,
+                 **kwargs):
+        Response.__init__(self, **kwargs)
+        self.name = "Response"
+        self.out = getattr(out, "write", out)
+        self.pending = None
+        self.started = False
+        self.buffer = []
+        self.buffered = 0
+        self.buffer_size = buffer_size
+
+        # WSGI write callables only take byte strings, and every verb is
+        # escaped to one
+        if xml_declaration:
+            self.emit(XML_DECLARATION.encode("utf-8"))
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        return False
+
+    def append(self, verb):
+        if self.out is None:
+            raise TwimlException("Can't append to closed %s" % self.name)
+        if verb.name not in self.nestables:
+            raise TwimlException("%s is not nestable inside %s" % \
+                (verb.name, self.name))
+
+        if self.started:
+            self.emit_pending()
+        else:
+            self.emit("<%s%s>" % (self.name, self.attributes()))
+            self.started = True
+
+        self.pending = verb
+        return verb
+
+    def emit(self, xml):
+        self.buffer.append(xml)
+        self.buffered += len(xml)
+        if self.buffered >= self.buffer_size:
+            self.flush()
+
+    def emit_pending(self):
+        self.pending.freeze()
+        self.emit(self.pending.frozen[False])
+        self.pending = None
+
+    def flush(self):
+        """
+        Write any buffered output to out
+        """
+        if self.buffer:
+            self.out("".join(self.buffer))
+            self.buffer = []
+            self.buffered = 0
+
+    def close(self):
+        """
+        Write the last verb and the closing tag, and flush the output. Closing
+        a closed response does nothing.
+        """
+        if self.out is None:
+            return
+
+        if self.started:
+            self.emit_pending()
+            self.emit("</%s>" % self.name)
+        else:
+            self.emit("<%s%s />" % (self.name, self.attributes()))
+
+        self.flush()
+        self.out = None
+
+
 class Say(Verb):
     """The :class:`Say` verb converts text to speech that is read back to the
     caller.
@@ -183,6 +518,8 @@ class Say(Verb):
                  Specifying '0' will cause the the :class:`Say` verb to loop
                  until the call is hung up.
     """
+    __slots__ = ()
+
     MAN = 'man'
     WOMAN = 'woman'
 
@@ -214,6 +551,8 @@ class Play(Verb):
                  Specifying '0' will cause the the :class:`Say` verb to loop
                  until the call is hung up. Defaults to 1.
     """
+    __slots__ = ()
+
     def __init__(self, url, loop=None, **kwargs):
         Verb.__init__(self, loop=loop, **kwargs)
         self.body = url
@@ -225,6 +564,8 @@ class Pause(Verb):
     :param length: specifies how many seconds Twilio will wait silently before
                    continuing on.
     """
+    __slots__ = ()
+
     def __init__(self, length=None, **kwargs):
         Verb.__init__(self, length=length, **kwargs)
 
@@ -237,6 +578,8 @@ class Redirect(Verb):
 
     :param method: specifies the HTTP method to use when retrieving the url
     """
+    __slots__ = ()
+
     GET = 'GET'
     POST = 'POST'
 
@@ -251,6 +594,8 @@ class Redirect(Verb):
 class Hangup(Verb):
     """Hangup the call
     """
+    __slots__ = ()
+
     def __init__(self, **kwargs):
         Verb.__init__(self)
 
@@ -258,6 +603,8 @@ class Hangup(Verb):
 class Reject(Verb):
     """Hangup the call
     """
+    __slots__ = ()
+
     def __init__(self, reason=None, **kwargs):
         Verb.__init__(self, reason=reason, **kwargs)
 
@@ -271,9 +618,13 @@ class Gather(Verb):
     :param timeout: wait for this many seconds before returning
     :param finishOnKey: key that triggers the end of caller input
     """
+    __slots__ = ()
+
     GET = 'GET'
     POST = 'POST'
 
+    nestables = frozenset(['Say', 'Play', 'Pause'])
+
     def __init__(self, action=None, method=None, numDigits=None, timeout=None,
         finishOnKey=None, **kwargs):
 
@@ -283,7 +634,6 @@ class Gather(Verb):
         if method and (method != self.GET and method != self.POST):
             raise TwimlException( \
                 "Invalid method parameter, must be 'GET' or 'POST'")
-        self.nestables = ['Say', 'Play', 'Pause']
 
     def say(self, text, **kwargs):
         return self.append(Say(text, **kwargs))
@@ -310,6 +660,8 @@ class Number(Verb):
     :param number: phone number to dial
     :param sendDigits: key to press after connecting to the number
     """
+    __slots__ = ()
+
     def __init__(self, number, sendDigits=None, **kwargs):
         Verb.__init__(self, sendDigits=sendDigits, **kwargs)
         self.body = number
@@ -324,6 +676,8 @@ class Sms(Verb):
     :param method: submit to 'action' url using GET or POST
     :param statusCallback: url to hit when the message is actually sent
     """
+    __slots__ = ()
+
     GET = 'GET'
     POST = 'POST'
 
@@ -348,6 +702,8 @@ class Conference(Verb):
     :param waitUrl: TwiML url that executes before conference starts
     :param waitMethod: HTTP method for waitUrl GET/POST
     """
+    __slots__ = ()
+
     GET = 'GET'
     POST = 'POST'
 
@@ -370,12 +726,15 @@ class Dial(Verb):
     :param action: submit the result of the dial to this URL
     :param method: submit to 'action' url using GET or POST
     """
+    __slots__ = ()
+
     GET = 'GET'
     POST = 'POST'
 
+    nestables = frozenset(['Number', 'Conference'])
+
     def __init__(self, number=None, action=None, method=None, **kwargs):
         Verb.__init__(self, action=action, method=method, **kwargs)
-        self.nestables = ['Number', 'Conference']
         if number and len(number.split(',')) > 1:
             for n in number.split(','):
                 self.append(Number(n.strip()))
@@ -406,6 +765,8 @@ class Record(Verb):
     :param maxLength: maximum number of seconds to record
     :param timeout: seconds of silence before considering the recording done
     """
+    __slots__ = ()
+
     GET = 'GET'
     POST = 'POST'
 